@@ -36,6 +36,11 @@ _NEWS_FAN_TIMEOUT_SECONDS = 30
 # friendly while still saturating most watchlists in one round-trip.
 _TAVILY_MAX_WORKERS = 5
 
+# Parallel workers for the per-ticker yfinance + indicator fetch. Each ticker
+# is an independent history download plus CPU-light indicator math, so a
+# watchlist costs roughly its slowest ticker instead of the sum.
+_TICKER_DATA_MAX_WORKERS = 5
+
 
 # ---------------------------------------------------------------------------
 # Pydantic models — define the exact shape of the LLM output
@@ -216,9 +221,7 @@ class BriefingService:
         if cached is not None:
             return cached
 
-        ticker_data = self._gather_ticker_data(tickers)
-        regime_data = self._get_market_regime()
-        news_data = self._gather_news(tickers)
+        ticker_data, regime_data, news_data = self._gather_all(tickers)
 
         result = self._synthesize(ticker_data, regime_data, news_data)
 
@@ -235,48 +238,77 @@ class BriefingService:
 
     # --- Data gathering ---------------------------------------------------
 
+    def _gather_all(
+        self, tickers: list[str]
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, list[NewsItem]]]:
+        """Run the three independent data fetches concurrently.
+
+        Ticker data (yfinance per ticker), the market regime (SPY/VIX) and
+        news (Tavily) share no state, so the gather phase costs the slowest
+        of the three instead of their sum. Each fetch already degrades to an
+        error entry / empty result on its own failures.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            ticker_future = pool.submit(self._gather_ticker_data, tickers)
+            regime_future = pool.submit(self._get_market_regime)
+            news_future = pool.submit(self._gather_news, tickers)
+            return ticker_future.result(), regime_future.result(), news_future.result()
+
     def _gather_ticker_data(self, tickers: list[str]) -> list[dict[str, Any]]:
-        """For each ticker: price, RSI, MACD, ADX, patterns."""
+        """For each ticker: price, RSI, MACD, ADX, patterns — fetched in parallel.
+
+        Results keep the input ticker order; a failing ticker surfaces as an
+        error entry without affecting the others.
+        """
+        if not tickers:
+            return []
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(len(tickers), _TICKER_DATA_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._fetch_ticker_entry, tickers))
+
+    def _fetch_ticker_entry(self, ticker: str) -> dict[str, Any]:
+        """Price, change and technical signals for one ticker."""
         from agents.technical_workflow.get_stock_data import YahooFinanceDataRetrieval
         from agents.technical_workflow.process_technical_indicators import TechnicalIndicators
         from agents.technical_workflow.pattern_recognition import PatternRecognitionEngine
 
-        results = []
-        for ticker in tickers:
-            entry: dict[str, Any] = {"ticker": ticker}
-            try:
-                retriever = YahooFinanceDataRetrieval(ticker)
-                hist = retriever.get_historical_prices(period="3mo")
-
-                if hist is None or hist.empty:
-                    entry["error"] = "No data available"
-                    results.append(entry)
-                    continue
-
-                entry["price"] = round(float(hist["Close"].iloc[-1]), 2)
-                if len(hist) >= 2:
-                    prev = float(hist["Close"].iloc[-2])
-                    entry["change_pct"] = round(
-                        (entry["price"] - prev) / prev * 100, 2
-                    )
-
-                ti = TechnicalIndicators(ticker)
-                indicators = ti.calculate_all_indicators(hist)
-                self._merge_indicators(entry, indicators)
-
-                engine = PatternRecognitionEngine()
-                patterns = engine.detect_all_patterns(hist)
-                if patterns:
-                    entry["patterns"] = [
-                        f"{p['type'].replace('_', ' ')} ({p['direction']}, {p['confidence']*100:.0f}%)"
-                        for p in patterns[:3]
-                    ]
-
-            except Exception as e:
-                entry["error"] = str(e)
-
-            results.append(entry)
-        return results
+        entry: dict[str, Any] = {"ticker": ticker}
+        try:
+            retriever = YahooFinanceDataRetrieval(ticker)
+            hist = retriever.get_historical_prices(period="3mo")
+
+            if hist is None or hist.empty:
+                entry["error"] = "No data available"
+                return entry
+
+            entry["price"] = round(float(hist["Close"].iloc[-1]), 2)
+            if len(hist) >= 2:
+                prev = float(hist["Close"].iloc[-2])
+                entry["change_pct"] = round(
+                    (entry["price"] - prev) / prev * 100, 2
+                )
+
+            ti = TechnicalIndicators(ticker)
+            indicators = ti.calculate_all_indicators(hist)
+            self._merge_indicators(entry, indicators)
+
+            engine = PatternRecognitionEngine()
+            patterns = engine.detect_all_patterns(hist)
+            if patterns:
+                entry["patterns"] = [
+                    f"{p['type'].replace('_', ' ')} ({p['direction']}, {p['confidence']*100:.0f}%)"
+                    for p in patterns[:3]
+                ]
+
+        except Exception as e:
+            entry["error"] = str(e)
+
+        return entry
 
     def _merge_indicators(self, entry: dict[str, Any], indicators: dict[str, Any]) -> None:
         """Copy RSI, MACD, and ADX values from indicators dict into the entry dict."""
@@ -8,21 +8,33 @@ Architecture:
 Streaming:
 - stream_sync() yields events as the graph executes (node transitions,
   tool calls, thinking blocks, tokens, final response)
-- invoke() remains unchanged for backward compatibility
+- invoke() remains unchanged for backward compatibility; ainvoke() is its
+  non-blocking counterpart for async callers
 """
 
 import asyncio
-import json
+import functools
+import hashlib
 import logging
 import os
-from typing import Dict, Any, TypedDict, Annotated, Optional, List, Literal, Generator, Union
+import threading
+import weakref
+from types import MappingProxyType
+from typing import Dict, Any, TypedDict, Annotated, Optional, List, Literal, Generator, Union, Callable, AsyncIterator
+import orjson
+from cachetools import LRUCache
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, BaseMessage
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import create_react_agent
 from langgraph.types import Send
 
+from agents.llm_cache import (
+    get_cached_response,
+    make_cache_key,
+    set_cached_response,
+)
 from agents.llm_utils import extract_text, parse_llm_response
 from agents.prompts import (
     SEC_AGENT_SYSTEM_PROMPT,
@@ -35,6 +47,7 @@ from agents.planner import (
     QueryClassification,
     AnalysisStep,
     create_planner,
+    is_simple_lookup,
 )
 from api.llm_concurrency import llm_slot
 
@@ -106,7 +119,16 @@ def merge_step_results(
     Keys are unique by construction (one step_id per worker), so dict union is
     commutative and associative — the requirements LangGraph imposes on
     reducers for parallel writes.
+
+    LangGraph folds each worker's delta in one at a time, so the common
+    "nothing merged yet" / "empty delta" cases return the other side as-is
+    instead of copying it. Nothing mutates step_results in place, so sharing
+    the dict is safe.
     """
+    if not left:
+        return right
+    if not right:
+        return left
     return {**left, **right}
 
 
@@ -155,6 +177,9 @@ class AnalysisState(TypedDict):
     # Core
     messages: Annotated[List[BaseMessage], add_messages]
     ticker: str
+    # Latest HumanMessage text, resolved once when the run starts. Nodes only
+    # ever append AI messages, so it stays valid for the whole run.
+    latest_query: str
 
     # Planning
     query_complexity: str  # simple | moderate | complex
@@ -177,6 +202,15 @@ def _get_latest_query(messages: List[BaseMessage]) -> str:
     return ""
 
 
+def _state_query(state: AnalysisState) -> str:
+    """The run's user query — precomputed `latest_query`, else a scan.
+
+    The fallback keeps nodes working on hand-built states (tests, custom
+    graphs) that don't go through `PlanningAgent._build_initial_state`.
+    """
+    return state.get("latest_query") or _get_latest_query(state["messages"])
+
+
 def _create_tools(ticker: str, llm: BaseChatModel, tavily_api_key: Optional[str] = None, user_id: str | None = None):
     """Create all available tools for the ticker."""
     from agents.tools.sec_tools import create_sec_tools
@@ -224,19 +258,38 @@ UNCLEAR_QUERY_RESPONSE = (
 )
 
 
+# Classification recorded for queries the deterministic pre-filter routes.
+_SIMPLE_LOOKUP_CLASSIFICATION = QueryClassification(
+    complexity="simple",
+    reasoning="Single-metric lookup matched without LLM classification",
+    estimated_tools=1,
+)
+
+
 def create_router_node(planner: QueryPlanner):
-    """Create router node that classifies query complexity."""
+    """Create router node that classifies query complexity.
+
+    Classification and planning come back from one LLM call
+    (`classify_and_plan`); on the complex path the plan is stashed in state so
+    the planner node doesn't make a second sequential call. Single-metric
+    lookups matched by `is_simple_lookup` skip that call entirely.
+    """
 
     async def router(state: AnalysisState) -> AnalysisState:
-        query = _get_latest_query(state["messages"])
+        query = _state_query(state)
 
         if not query:
             state["query_complexity"] = "simple"
             state["classification"] = None
             return state
 
-        classification = await _run_with_timeout(
-            asyncio.to_thread(planner.classify_query, query),
+        if is_simple_lookup(query):
+            state["query_complexity"] = "simple"
+            state["classification"] = _SIMPLE_LOOKUP_CLASSIFICATION
+            return state
+
+        classification, plan = await _run_with_timeout(
+            asyncio.to_thread(planner.classify_and_plan, query),
             label="classify_query",
         )
         state["classification"] = classification
@@ -252,24 +305,99 @@ def create_router_node(planner: QueryPlanner):
             state["query_complexity"] = "simple"
         else:
             state["query_complexity"] = "complex"
+            if plan is not None and plan.steps:
+                state["plan"] = plan
 
         return state
 
     return router
 
 
-def create_react_node(react_agent: Any):
-    """Create node that runs the ReAct agent for simple queries."""
+def create_react_node(
+    react_agent: Any = None, *, agent_factory: Optional[Callable[[], Any]] = None
+):
+    """Create node that runs the ReAct agent for simple queries.
+
+    Inside workflow.astream() the agent is streamed and its answer tokens are
+    forwarded through the stream writer. Each agent message's tokens go out
+    when it ends without tool calls, so text the model writes before a tool
+    call never reaches the caller. Without a writer it runs via ainvoke().
+
+    Pass `agent_factory` instead of `react_agent` to defer building the agent
+    until the first simple query reaches this node; the result is memoized.
+    """
+    if react_agent is None and agent_factory is None:
+        raise ValueError("create_react_node needs react_agent or agent_factory")
+    get_agent = functools.cache(agent_factory) if react_agent is None else None
 
     async def react_node(state: AnalysisState) -> AnalysisState:
+        agent = react_agent if get_agent is None else get_agent()
         # Truncate history before passing to the LLM so multi-turn sessions
         # don't compound input-token cost.
         bounded_messages = _truncate_messages(state["messages"])
 
-        result = await _run_with_timeout(
-            react_agent.ainvoke({"messages": bounded_messages}),
-            label="react_agent",
-        )
+        writer = None
+        try:
+            from langgraph.config import get_stream_writer
+
+            writer = get_stream_writer()
+        except Exception:
+            pass
+
+        if writer:
+            async def _stream() -> Optional[Dict[str, Any]]:
+                final_state = None
+                # Events for the agent message being streamed. A turn may say
+                # "Let me look up the P/E..." before calling a tool, so its
+                # events are held until the message ends without tool calls;
+                # otherwise the tokens wouldn't add up to the final response.
+                pending: List[Dict[str, Any]] = []
+                calls_tools = False
+                message_id = None
+
+                def end_message() -> None:
+                    nonlocal calls_tools
+                    if not calls_tools:
+                        for event in pending:
+                            writer(event)
+                    pending.clear()
+                    calls_tools = False
+
+                async for mode, payload in agent.astream(
+                    {"messages": bounded_messages}, stream_mode=["messages", "values"]
+                ):
+                    if mode == "values":
+                        # A node finished, so any agent message is complete.
+                        end_message()
+                        final_state = payload
+                        continue
+                    chunk, metadata = payload
+                    # Only the agent's own messages: skip tool results and LLM
+                    # calls made inside tools (the SEC analysis tools run their
+                    # own chains under "tools").
+                    if not (
+                        isinstance(chunk, AIMessageChunk)
+                        and metadata.get("langgraph_node") == "agent"
+                    ):
+                        continue
+                    if chunk.id != message_id:
+                        end_message()
+                        message_id = chunk.id
+                    if chunk.tool_call_chunks:
+                        calls_tools = True
+                    else:
+                        _process_streaming_chunk(chunk, pending.append)
+                    if chunk.chunk_position == "last":
+                        end_message()
+                end_message()
+                return final_state
+
+            result = await _run_with_timeout(_stream(), label="react_agent_stream")
+        else:
+            result = await _run_with_timeout(
+                agent.ainvoke({"messages": bounded_messages}),
+                label="react_agent",
+            )
 
         if result and "messages" in result:
             response = extract_text(result["messages"][-1].content)
@@ -282,16 +410,34 @@ def create_react_node(react_agent: Any):
     return react_node
 
 
-def create_planner_node(planner: QueryPlanner):
-    """Create node that generates an execution plan for complex queries."""
+def create_planner_node(
+    planner: QueryPlanner, tool_names: Optional[frozenset] = None
+):
+    """Create node that generates an execution plan for complex queries.
 
-    async def planner_node(state: AnalysisState) -> AnalysisState:
-        query = _get_latest_query(state["messages"])
+    Reuses the plan the router got from `classify_and_plan` when there is one;
+    only calls the LLM when the combined call came back without a plan.
 
-        plan = await _run_with_timeout(
-            asyncio.to_thread(planner.create_plan, query),
-            label="create_plan",
-        )
+    With `tool_names`, steps naming a tool that doesn't exist are dropped here
+    (and logged) so they never fan out into a worker that can only fail.
+    """
+
+    async def planner_node(state: AnalysisState) -> AnalysisState:
+        plan = state.get("plan")
+        if plan is None:
+            query = _state_query(state)
+            plan = await _run_with_timeout(
+                asyncio.to_thread(planner.create_plan, query),
+                label="create_plan",
+            )
+        if tool_names is not None and plan is not None:
+            valid_steps = [step for step in plan.steps if step.tool in tool_names]
+            if len(valid_steps) != len(plan.steps):
+                logger.warning(
+                    "Dropping plan steps with unknown tools: %s",
+                    sorted({s.tool for s in plan.steps if s.tool not in tool_names}),
+                )
+                plan = plan.model_copy(update={"steps": valid_steps})
         state["plan"] = plan
         state["step_results"] = {}
 
@@ -300,6 +446,15 @@ def create_planner_node(planner: QueryPlanner):
     return planner_node
 
 
+# Tool outputs at least this many characters long are JSON-parsed off the
+# event loop. Full 10-K sections and structured analyses run to hundreds of
+# thousands; parsing them inline stalls every other stream on the loop. Small
+# results parse faster than a thread hop costs. Measured in characters, not
+# bytes — parse cost tracks length, and encoding just to measure would add a
+# full copy on the loop. Env-overridable.
+STEP_RESULT_OFFLOAD_CHARS = int(os.getenv("STEP_RESULT_OFFLOAD_CHARS", "65536"))
+
+
 def _build_step_result(
     tool_name: str,
     raw: str,
@@ -315,10 +470,10 @@ def _build_step_result(
     data: Dict[str, Any] = {}
     if not error:
         try:
-            parsed = json.loads(raw)
+            parsed = orjson.loads(raw)
             if isinstance(parsed, dict):
                 data = parsed
-        except (json.JSONDecodeError, TypeError):
+        except (orjson.JSONDecodeError, TypeError):
             pass
 
     return StepResult(
@@ -333,9 +488,11 @@ def _build_step_result(
 def create_worker_node(tools_dict: Dict[str, Any]):
     """Create the per-step worker node fanned out via Send.
 
-    The worker receives a Send payload `{"step": AnalysisStep}` and runs the
-    tool referenced by that step. It returns `{"step_results": {step_id: ...}}`,
-    which `merge_step_results` unions into the parent state.
+    The worker receives a Send payload `{"step": AnalysisStep, "step_ids":
+    [...]}` and runs the tool referenced by that step once. It returns
+    `{"step_results": {step_id: ...}}` with the same result under every id in
+    `step_ids` (see `dispatch_steps`), which `merge_step_results` unions into
+    the parent state.
 
     Async dispatch: the worker is `async def` and calls `tool.ainvoke(...)`.
     LangChain `Tool` auto-bridges sync `func=` callables to a thread pool, so
@@ -349,27 +506,39 @@ def create_worker_node(tools_dict: Dict[str, Any]):
     handling needed, unlike the previous ThreadPoolExecutor implementation.
     """
 
+    tools_get = tools_dict.get
+
     async def worker(payload: Dict[str, Any]) -> Dict[str, Any]:
         step: AnalysisStep = payload["step"]
 
-        if step.tool not in tools_dict:
+        tool = tools_get(step.tool)
+        if tool is None:
             msg = f"Tool '{step.tool}' not found"
             result = _build_step_result(step.tool, f"[ERROR: {msg}]", error=msg)
         else:
             try:
-                raw = str(await tools_dict[step.tool].ainvoke(""))
-                result = _build_step_result(step.tool, raw)
+                raw = str(await tool.ainvoke(""))
+                if len(raw) >= STEP_RESULT_OFFLOAD_CHARS:
+                    result = await asyncio.to_thread(_build_step_result, step.tool, raw)
+                else:
+                    result = _build_step_result(step.tool, raw)
             except Exception as e:
                 msg = str(e)
                 result = _build_step_result(step.tool, f"[ERROR: {msg}]", error=msg)
 
-        return {"step_results": {step.id: result}}
+        step_ids = payload.get("step_ids") or (step.id,)
+        return {"step_results": {step_id: result for step_id in step_ids}}
 
     return worker
 
 
 def dispatch_steps(state: AnalysisState) -> Union[List[Send], List[str]]:
-    """Conditional edge from `planner`: fan out one Send per plan step.
+    """Conditional edge from `planner`: fan out one Send per distinct tool call.
+
+    Tools take no arguments (the ticker is bound at construction), so two
+    steps naming the same tool are the same call — the planner often emits
+    several angles on one statement. Those steps share a single Send whose
+    `step_ids` lists every step the worker should write the result under.
 
     `depends_on` is intentionally ignored — every step runs in parallel in a
     single LangGraph superstep. The planner emits independent steps in
@@ -381,7 +550,19 @@ def dispatch_steps(state: AnalysisState) -> Union[List[Send], List[str]]:
     plan = state.get("plan")
     if not plan or not plan.steps:
         return ["synthesizer"]
-    return [Send("worker", {"step": step}) for step in plan.steps]
+    # tool name → (first step, ids of every step calling it); dict preserves
+    # plan order so Sends go out in the order the planner listed them.
+    unique: Dict[str, tuple] = {}
+    for step in plan.steps:
+        entry = unique.get(step.tool)
+        if entry is None:
+            unique[step.tool] = (step, [step.id])
+        else:
+            entry[1].append(step.id)
+    return [
+        Send("worker", {"step": step, "step_ids": step_ids})
+        for step, step_ids in unique.values()
+    ]
 
 
 # Structured fields the reconciler compares across step_results sharing a
@@ -446,7 +627,11 @@ def _format_step_result_for_prompt(result: StepResult) -> str:
     for prose-returning tools (stock, market, briefing) and error markers.
     """
     if result.get("data"):
-        return json.dumps(result["data"], indent=2, default=str)
+        return orjson.dumps(
+            result["data"],
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
     return result.get("raw", "[No result]")
 
 
@@ -468,12 +653,28 @@ def _format_conflicts_for_prompt(conflicts: List[Conflict]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def _build_synthesis_prompt(state: AnalysisState, ticker: str) -> str:
-    """Build the synthesis prompt from plan state. Shared by streaming and non-streaming paths."""
+def _bind_synthesis_template(ticker: str) -> str:
+    """Pre-substitute `{ticker}` into SYNTHESIS_SYSTEM_PROMPT.
+
+    The ticker is fixed per synthesizer node, so it is bound once at graph
+    construction; each synthesis then only formats the per-run fields.
+    """
+    escaped = ticker.replace("{", "{{").replace("}", "}}")
+    return SYNTHESIS_SYSTEM_PROMPT.replace("{ticker}", escaped)
+
+
+def _build_synthesis_prompt(
+    state: AnalysisState, ticker: str, template: Optional[str] = None
+) -> str:
+    """Build the synthesis prompt from plan state. Shared by streaming and non-streaming paths.
+
+    `template` is a prompt already bound to `ticker` via
+    `_bind_synthesis_template`; without one the raw template is formatted.
+    """
     plan = state["plan"]
     step_results = state["step_results"]
     conflicts = state.get("conflicts") or []
-    query = _get_latest_query(state["messages"])
+    query = _state_query(state)
 
     results_text = []
     if plan:
@@ -488,22 +689,56 @@ def _build_synthesis_prompt(state: AnalysisState, ticker: str) -> str:
 
     synthesis_approach = plan.synthesis_approach if plan else "Combine findings into a comprehensive answer"
 
+    step_results_text = "\n".join(results_text) + _format_conflicts_for_prompt(conflicts)
+    if template is not None:
+        return template.format(
+            step_results=step_results_text,
+            query=query,
+            synthesis_approach=synthesis_approach,
+        )
     return SYNTHESIS_SYSTEM_PROMPT.format(
         ticker=ticker,
-        step_results="\n".join(results_text) + _format_conflicts_for_prompt(conflicts),
+        step_results=step_results_text,
         query=query,
         synthesis_approach=synthesis_approach,
     )
 
 
+def _single_step_passthrough(state: AnalysisState) -> Optional[str]:
+    """Return the lone step's prose output when synthesis would add nothing.
+
+    A one-step plan whose tool returned readable prose (stock info, market
+    overview, briefing history) is already the answer — an LLM pass would
+    only restate it. Structured JSON payloads, errors and reconciler
+    conflicts still go through the synthesizer.
+    """
+    plan = state.get("plan")
+    if not plan or len(plan.steps) != 1 or state.get("conflicts"):
+        return None
+    result = (state.get("step_results") or {}).get(plan.steps[0].id)
+    if not result or result.get("error") or result.get("data"):
+        return None
+    raw = result.get("raw") or ""
+    return raw if raw.strip() else None
+
+
 def _process_streaming_chunk(chunk, writer) -> str:
     """Process a single LLM streaming chunk, emitting events via writer.
 
     Uses parse_llm_response from llm_utils for consistent parsing,
-    then emits thinking/token events via the stream writer.
+    then emits thinking/token events via the stream writer. Each chunk yields
+    at most one thinking and one token event — block lists are coalesced.
 
     Returns the text content extracted from this chunk (for accumulation).
     """
+    content = getattr(chunk, "content", chunk)
+    if type(content) is str:
+        # Fast path: plain-text chunks (no thinking) are the overwhelming
+        # majority of a token stream — skip the block parser entirely.
+        if content:
+            writer({"type": "token", "message": content})
+        return content
+
     parsed = parse_llm_response(chunk)
 
     if parsed.thinking:
@@ -522,11 +757,15 @@ def create_synthesizer_node(llm: BaseChatModel, ticker: str):
       thinking blocks and tokens in real-time as the LLM generates them.
     - Non-streaming (via workflow.invoke): falls back to llm.invoke() for
       the complete response at once. This keeps backward compatibility.
+
+    Responses are cached on the exact prompt (see agents/llm_cache.py). A hit
+    skips the LLM; in streaming mode the cached text goes out as one token.
+    Single-step plans with a prose result skip the LLM the same way.
     """
 
-    async def synthesizer(state: AnalysisState) -> AnalysisState:
-        prompt = _build_synthesis_prompt(state, ticker)
+    template = _bind_synthesis_template(ticker)
 
+    async def synthesizer(state: AnalysisState) -> AnalysisState:
         # Try to get a stream writer — only available inside workflow.stream()
         writer = None
         try:
@@ -536,15 +775,34 @@ def create_synthesizer_node(llm: BaseChatModel, ticker: str):
         except Exception:
             pass
 
+        passthrough = _single_step_passthrough(state)
+        if passthrough is not None:
+            if writer:
+                writer({"type": "token", "message": passthrough})
+            state["final_response"] = passthrough
+            return state
+
+        prompt = _build_synthesis_prompt(state, ticker, template)
+        cache_key = make_cache_key("synthesis", llm, prompt)
+        cached = get_cached_response(cache_key)
+        if cached is not None:
+            if writer:
+                writer({"type": "token", "message": cached})
+            state["final_response"] = cached
+            return state
+
         if writer:
             # Streaming path: emit tokens/thinking as they arrive. The entire
             # stream has a single deadline — total synthesis time can't exceed
             # LLM_CALL_TIMEOUT even with thinking enabled.
             async def _stream() -> str:
-                full = ""
+                # Collect chunks and join once — a long answer is hundreds
+                # of tiny token chunks, and += would re-copy the whole
+                # response on each one outside CPython's in-place fast path.
+                parts: List[str] = []
                 async for chunk in llm.astream(prompt):
-                    full += _process_streaming_chunk(chunk, writer)
-                return full
+                    parts.append(_process_streaming_chunk(chunk, writer))
+                return "".join(parts)
 
             state["final_response"] = await _run_with_timeout(
                 _stream(), label="synthesizer_stream"
@@ -555,6 +813,7 @@ def create_synthesizer_node(llm: BaseChatModel, ticker: str):
             )
             state["final_response"] = extract_text(response.content)
 
+        set_cached_response(cache_key, state["final_response"])
         return state
 
     return synthesizer
@@ -583,12 +842,57 @@ def route_by_complexity(state: AnalysisState) -> Literal["react_agent", "planner
 # =============================================================================
 
 
+# Compiled workflows keyed on everything the graph closes over. Tool
+# registration, prompt formatting and graph compilation are pure overhead for
+# a repeat (ticker, LLM) pair; compiled graphs are stateless between runs
+# (state is built fresh per invoke), so one instance serves every session.
+# Keyed by LLM instance id — the instance carries the caller's API key, so
+# distinct clients never share a graph. Cached entries hold a strong ref to
+# their LLMs, so an id can't be recycled while its entry is alive. The Tavily
+# key is hashed (as in llm_factory) so raw secrets never sit in a cache key.
+WORKFLOW_CACHE_SIZE = int(os.getenv("WORKFLOW_CACHE_SIZE", "64"))
+_workflow_cache: LRUCache = LRUCache(maxsize=WORKFLOW_CACHE_SIZE)
+_workflow_cache_lock = threading.Lock()
+
+
+def _key_hash(api_key: Optional[str]) -> Optional[str]:
+    """sha256 of an API key, so raw secrets never sit in a cache key."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else None
+
+
 def create_planning_workflow(
     llm: BaseChatModel,
     ticker: str,
     tavily_api_key: Optional[str] = None,
     synthesizer_llm: Optional[BaseChatModel] = None,
     user_id: str | None = None,
+) -> StateGraph:
+    """Return the compiled planning workflow, reusing a cached one when possible.
+
+    See `_build_planning_workflow` for the graph layout and arguments.
+    """
+    key = (ticker, _key_hash(tavily_api_key), id(llm), id(synthesizer_llm), user_id)
+    with _workflow_cache_lock:
+        cached = _workflow_cache.get(key)
+    if cached is not None:
+        return cached[0]
+
+    workflow = _build_planning_workflow(
+        llm, ticker, tavily_api_key, synthesizer_llm, user_id=user_id
+    )
+    with _workflow_cache_lock:
+        # Another thread may have compiled the same key meanwhile; keep the
+        # first so every caller shares one graph.
+        cached = _workflow_cache.setdefault(key, (workflow, llm, synthesizer_llm))
+    return cached[0]
+
+
+def _build_planning_workflow(
+    llm: BaseChatModel,
+    ticker: str,
+    tavily_api_key: Optional[str] = None,
+    synthesizer_llm: Optional[BaseChatModel] = None,
+    user_id: str | None = None,
 ) -> StateGraph:
     """
     Create the unified LangGraph workflow with planning capabilities.
@@ -614,17 +918,19 @@ def create_planning_workflow(
 
     planner = create_planner(llm, ticker, has_research)
 
-    # Create ReAct agent for simple queries
-    system_prompt = SEC_AGENT_SYSTEM_PROMPT.format(ticker=ticker)
-    react_agent = create_react_agent(llm, tools, prompt=system_prompt)
+    # ReAct agent for simple queries — compiled on the first simple query, so
+    # a workflow that only ever sees complex queries never pays for it.
+    def build_react_agent():
+        system_prompt = SEC_AGENT_SYSTEM_PROMPT.format(ticker=ticker)
+        return create_react_agent(llm, tools, prompt=system_prompt)
 
     # Build the graph
     workflow = StateGraph(AnalysisState)
 
     # Add nodes — synthesizer gets its own LLM (optionally with thinking)
     workflow.add_node("router", create_router_node(planner))
-    workflow.add_node("react_agent", create_react_node(react_agent))
-    workflow.add_node("planner", create_planner_node(planner))
+    workflow.add_node("react_agent", create_react_node(agent_factory=build_react_agent))
+    workflow.add_node("planner", create_planner_node(planner, frozenset(tools_dict)))
     workflow.add_node("worker", create_worker_node(tools_dict))
     workflow.add_node("reconciler", create_reconciler_node())
     workflow.add_node("synthesizer", create_synthesizer_node(synthesizer_llm or llm, ticker))
@@ -656,13 +962,57 @@ def create_planning_workflow(
 # =============================================================================
 
 
+# Marks the normal end of a shared run on every subscriber queue.
+_RUN_DONE = object()
+
+
+class _InflightRun:
+    """One graph run whose events are fanned out to every subscriber.
+
+    Each subscriber gets its own queue, pre-filled with the events streamed
+    so far so late joiners catch up, then fed live as events arrive. The run
+    ends with ``_RUN_DONE`` or the exception that stopped it.
+    """
+
+    __slots__ = ("events", "queues", "task")
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+        self.queues: List["asyncio.Queue[Any]"] = []
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    def subscribe(self) -> "asyncio.Queue[Any]":
+        queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        for event in self.events:
+            queue.put_nowait(event)
+        self.queues.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[Any]") -> None:
+        """Drop a subscriber; the run is cancelled once nobody is listening."""
+        self.queues.remove(queue)
+        if not self.queues and self.task is not None and not self.task.done():
+            self.task.cancel()
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        self.events.append(event)
+        for queue in self.queues:
+            queue.put_nowait(event)
+
+    def finish(self, outcome: Any) -> None:
+        for queue in self.queues:
+            queue.put_nowait(outcome)
+
+
 class PlanningAgent:
     """
     Wrapper that provides a consistent interface for the planning workflow.
 
-    Three execution modes:
+    Execution modes:
     - invoke(): blocks until done, returns final result (for tests, simple callers)
+    - ainvoke(): awaitable invoke() for async callers that don't need events
     - stream(): async generator using astream() — preferred for async handlers (FastAPI)
+    - astream(): answer text only, token by token, on top of stream()
     - stream_sync(): sync generator using stream() — for testing with mocked workflows
     """
 
@@ -676,25 +1026,59 @@ class PlanningAgent:
         "synthesizer": "Synthesizing final response...",
     }
 
+    # One prebuilt event per known node, yielded as-is on every transition.
+    # Consumers only serialize events, so sharing the dicts is safe — treat
+    # them as read-only.
+    _NODE_EVENTS = {
+        name: {"type": "node", "node": name, "message": message}
+        for name, message in _NODE_MESSAGES.items()
+    }
+
+    # In-flight async runs per event loop, keyed by (dedup namespace,
+    # conversation digest). Concurrent identical requests — same ticker,
+    # models, tools, user and history — subscribe to the first run's events
+    # instead of re-running the graph. Queues and tasks are bound to their
+    # loop, so runs are never shared across loops.
+    _inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _InflightRun]]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(
         self,
         workflow: StateGraph,
         ticker: str,
+        dedup_namespace: Optional[str] = None,
     ):
         self.workflow = workflow
         self.ticker = ticker
+        # Per-agent invariants of the initial state, built once and read-only.
+        self._state_template = MappingProxyType({
+            "ticker": ticker,
+            "query_complexity": "",
+            "classification": None,
+            "plan": None,
+            "final_response": "",
+        })
+        # None disables in-flight dedup (mocked workflows in tests, ad-hoc agents).
+        self.dedup_namespace = dedup_namespace
+
+    @classmethod
+    def _node_event(cls, node_name: str) -> Dict[str, Any]:
+        """Node-transition event for `node_name` (prebuilt for known nodes)."""
+        event = cls._NODE_EVENTS.get(node_name)
+        if event is None:
+            event = {"type": "node", "node": node_name, "message": f"Running {node_name}..."}
+        return event
 
     def _build_initial_state(self, messages: List[BaseMessage]) -> AnalysisState:
         """Build the initial state dict. Shared by invoke() and stream_sync()."""
         return {
+            **self._state_template,
             "messages": messages,
-            "ticker": self.ticker,
-            "query_complexity": "",
-            "classification": None,
-            "plan": None,
+            "latest_query": _get_latest_query(messages),
+            # Mutable containers stay per-run so no run can leak into another.
             "step_results": {},
             "conflicts": [],
-            "final_response": "",
         }
 
     def invoke(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -711,8 +1095,26 @@ class PlanningAgent:
         initial_state = self._build_initial_state(messages)
 
         final_state = self.workflow.invoke(initial_state)
+        return self._result_messages(messages, final_state)
+
+    async def ainvoke(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Async counterpart of invoke() for callers already on an event loop.
 
-        response = final_state.get("final_response", "")
+        Every graph node is `async def`, so this runs them natively instead
+        of blocking the loop while LLM and tool calls are in flight.
+        """
+        messages = inputs.get("messages", [])
+        initial_state = self._build_initial_state(messages)
+
+        final_state = await self.workflow.ainvoke(initial_state)
+        return self._result_messages(messages, final_state)
+
+    @staticmethod
+    def _result_messages(
+        messages: List[BaseMessage], final_state: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Append the final response (if any) to the conversation."""
+        response = final_state.get("final_response")
         if response:
             return {"messages": messages + [AIMessage(content=response)]}
 
@@ -725,10 +1127,10 @@ class PlanningAgent:
     ) -> Generator[Dict[str, Any], None, None]:
         """Convert a worker node's state delta into one tool event per step.
 
-        Send-based fan-out emits one updates-mode chunk per worker. Each
-        worker's `step_results` delta carries exactly one (step_id → result)
-        entry — but iterating defensively handles the case where multiple
-        workers' updates get coalesced into a single emission.
+        Send-based fan-out emits one updates-mode chunk per worker. A worker's
+        `step_results` delta carries one entry per step it served — more than
+        one when `dispatch_steps` collapsed duplicate tool calls — and multiple
+        workers' updates may also be coalesced into a single emission.
         """
         if not plan:
             return
@@ -803,13 +1205,7 @@ class PlanningAgent:
             elif mode == "updates":
                 # Node completion events: chunk is {node_name: state_delta}
                 for node_name, state_update in chunk.items():
-                    yield {
-                        "type": "node",
-                        "node": node_name,
-                        "message": self._NODE_MESSAGES.get(
-                            node_name, f"Running {node_name}..."
-                        ),
-                    }
+                    yield self._node_event(node_name)
 
                     # Track the plan so we can look up tool names later
                     plan_update = state_update.get("plan")
@@ -826,6 +1222,18 @@ class PlanningAgent:
                     if final:
                         yield {"type": "response", "message": extract_text(final)}
 
+    def _inflight_key(self, messages: List[BaseMessage]) -> Optional[str]:
+        """Dedup key for a run, or None when dedup is disabled."""
+        if self.dedup_namespace is None:
+            return None
+        h = hashlib.sha256(self.dedup_namespace.encode("utf-8"))
+        for msg in messages:
+            h.update(b"\x00")
+            h.update(msg.type.encode("utf-8"))
+            h.update(b"\x01")
+            h.update(str(msg.content).encode("utf-8"))
+        return h.hexdigest()
+
     async def stream(
         self,
         inputs: Dict[str, Any],
@@ -835,29 +1243,113 @@ class PlanningAgent:
         Async generator yielding streaming events via LangGraph's native astream().
 
         This is the preferred method for async handlers (FastAPI WebSocket).
-        Uses astream(stream_mode="updates") which yields {node_name: state_delta}
-        after each node completes. Custom events (thinking/tokens) are emitted
-        via get_stream_writer() inside the synthesizer when available.
+        Uses astream(stream_mode=["updates", "custom"]): "updates" yields
+        {node_name: state_delta} after each node completes and becomes
+        node/tool/response events; "custom" carries the thinking/token events
+        the ReAct and synthesizer nodes emit via get_stream_writer().
 
         ``config`` is a LangChain RunnableConfig forwarded to the graph. Pass
         ``metadata={"session_id": ...}`` to group runs into a LangSmith thread.
+
+        Identical concurrent requests are coalesced: the first caller starts
+        the graph and every caller, later ones included, receives its events
+        live as they are produced. If the run fails before streaming anything,
+        later callers run the graph themselves; the first caller sees the error.
         """
         messages = inputs.get("messages", [])
+        key = self._inflight_key(messages)
+
+        if key is not None:
+            runs = self._inflight.setdefault(asyncio.get_running_loop(), {})
+            run = runs.get(key)
+            started = run is None
+            if started:
+                run = _InflightRun()
+                runs[key] = run
+                run.task = asyncio.create_task(self._drive_inflight(run, runs, key, messages, config))
+            else:
+                logger.info("Coalesced duplicate in-flight query for %s", self.ticker)
+
+            queue = run.subscribe()
+            received = False
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is _RUN_DONE:
+                        return
+                    if isinstance(item, BaseException):
+                        if started or received:
+                            raise item
+                        break
+                    received = True
+                    yield item
+            finally:
+                run.unsubscribe(queue)
+
+        async for event in self._astream_events(messages, config):
+            yield event
+
+    async def _drive_inflight(
+        self,
+        run: _InflightRun,
+        runs: Dict[str, _InflightRun],
+        key: str,
+        messages: List[BaseMessage],
+        config: Optional[Dict[str, Any]],
+    ) -> None:
+        """Run the graph once, publishing each event to the run's subscribers."""
+        try:
+            async for event in self._astream_events(messages, config):
+                run.publish(event)
+        except Exception as e:
+            outcome: Any = e
+        else:
+            outcome = _RUN_DONE
+        finally:
+            if runs.get(key) is run:
+                del runs[key]
+        run.finish(outcome)
+
+    async def astream(
+        self,
+        inputs: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """Yield only the answer text, as it is produced.
+
+        A thin view over stream() for callers that want the response body and
+        not the progress events (plain chunked/SSE responses). Token events
+        are yielded as they arrive; when a run produces no tokens (unclear
+        query, a non-streaming path) the final response is yielded whole.
+        """
+        streamed = False
+        async for event in self.stream(inputs, config=config):
+            if event["type"] == "token":
+                streamed = True
+                yield event["message"]
+            elif event["type"] == "response" and not streamed:
+                yield event["message"]
+
+    async def _astream_events(
+        self,
+        messages: List[BaseMessage],
+        config: Optional[Dict[str, Any]] = None,
+    ):
+        """Run the graph once via astream() and translate chunks into events."""
         initial_state = self._build_initial_state(messages)
         current_plan: Optional[QueryPlan] = None
 
-        async for chunk in self.workflow.astream(
-            initial_state, stream_mode="updates", config=config
+        async for mode, chunk in self.workflow.astream(
+            initial_state, stream_mode=["updates", "custom"], config=config
         ):
+            if mode == "custom":
+                # Events from get_stream_writer() (thinking, tokens)
+                yield chunk
+                continue
+
             # chunk is {node_name: state_delta}
             for node_name, state_update in chunk.items():
-                yield {
-                    "type": "node",
-                    "node": node_name,
-                    "message": self._NODE_MESSAGES.get(
-                        node_name, f"Running {node_name}..."
-                    ),
-                }
+                yield self._node_event(node_name)
 
                 plan_update = state_update.get("plan")
                 if plan_update is not None:
@@ -896,7 +1388,20 @@ def create_planning_agent(
         PlanningAgent instance with invoke() and stream_sync() methods
     """
     workflow = create_planning_workflow(llm, ticker, tavily_api_key, synthesizer_llm, user_id=user_id)
-    return PlanningAgent(workflow, ticker)
+    # Everything besides the conversation that shapes the answer: duplicate
+    # in-flight requests are only coalesced when all of these match. Like the
+    # workflow cache, LLMs are identified by instance — create_llm shares one
+    # per API key, so callers with different keys never share (or pay for)
+    # each other's run. The run holds its LLMs, so the ids can't be recycled
+    # while it is in flight.
+    dedup_namespace = "\x00".join((
+        ticker,
+        str(id(llm)),
+        str(id(synthesizer_llm or llm)),
+        _key_hash(tavily_api_key) or "",
+        user_id or "",
+    ))
+    return PlanningAgent(workflow, ticker, dedup_namespace=dedup_namespace)
 
 
 # =============================================================================
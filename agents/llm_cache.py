@@ -0,0 +1,102 @@
+"""Exact-match response cache for LLM calls with fully-rendered prompts.
+
+The router, planner and synthesizer each send one deterministic prompt string
+to the model. When the same prompt is sent to the same model again within the
+TTL (a repeated question against unchanged tool output), the stored response
+is returned and the LLM call is skipped entirely.
+
+Keys are sha256 over (namespace, model identity, prompt) so they are stable
+across processes and never hold prompt text in memory twice. Model identity
+comes from ``_identifying_params`` — model name, temperature, thinking budget
+— so a thinking-enabled synthesizer never serves a non-thinking response. It
+also carries a hash of the model's API key, so a response paid for with one
+key is never served to a caller holding another (or a revoked) key.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Any, Optional
+
+from cachetools import TTLCache
+from langchain_core.language_models.chat_models import BaseChatModel
+from pydantic import SecretStr
+
+# 15-min TTL matches the briefing/research cache convention. Tool output that
+# feeds the synthesis prompt (prices, news) changes on roughly that cadence,
+# and any change produces a different prompt — and so a different key — anyway.
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", "900"))
+LLM_CACHE_MAXSIZE = int(os.getenv("LLM_CACHE_MAXSIZE", "512"))
+
+_llm_cache: TTLCache = TTLCache(maxsize=LLM_CACHE_MAXSIZE, ttl=LLM_CACHE_TTL_SECONDS)
+
+# Planner calls run via asyncio.to_thread; TTLCache is not thread-safe.
+_llm_cache_lock = threading.Lock()
+
+
+def _credential_digest(llm: BaseChatModel) -> str:
+    """sha256 over the model's secret fields (its API key), or "" if none.
+
+    LangChain chat models hold their provider key as a SecretStr field
+    (google_api_key, openai_api_key, anthropic_api_key).
+    """
+    try:
+        fields = vars(llm)
+    except TypeError:
+        return ""
+    h = hashlib.sha256()
+    found = False
+    for name in sorted(fields):
+        value = fields[name]
+        if isinstance(value, SecretStr):
+            h.update(name.encode("utf-8"))
+            h.update(b"\x00")
+            h.update(value.get_secret_value().encode("utf-8"))
+            h.update(b"\x00")
+            found = True
+    return h.hexdigest() if found else ""
+
+
+def model_identity(llm: BaseChatModel) -> str:
+    """Stable description of the model configuration and API key behind `llm`."""
+    try:
+        params = llm._identifying_params
+    except Exception:
+        params = None
+    if params:
+        return (
+            f"{type(llm).__name__}:{sorted(params.items(), key=lambda kv: kv[0])!r}"
+            f":{_credential_digest(llm)}"
+        )
+    # Unknown model shape — fall back to the instance so we never share
+    # entries between models we can't tell apart.
+    return f"{type(llm).__name__}:{id(llm)}"
+
+
+def make_cache_key(namespace: str, llm: BaseChatModel, prompt: str) -> str:
+    """Hash (namespace, model identity, prompt) into a cache key."""
+    h = hashlib.sha256()
+    for part in (namespace, model_identity(llm), prompt):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[Any]:
+    """Return the cached response for `key`, or None on miss."""
+    with _llm_cache_lock:
+        return _llm_cache.get(key)
+
+
+def set_cached_response(key: str, value: Any) -> None:
+    """Store `value` under `key`. Empty responses are never cached."""
+    if not value:
+        return
+    with _llm_cache_lock:
+        _llm_cache[key] = value
+
+
+def clear_llm_cache() -> None:
+    """Drop every cached response (tests, model hot-swaps)."""
+    with _llm_cache_lock:
+        _llm_cache.clear()
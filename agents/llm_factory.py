@@ -13,9 +13,13 @@ Usage:
     llm, synthesizer = create_llm_pair("gpt-4o-mini", api_key="sk-...")
 """
 
+import hashlib
 import logging
+import os
+import threading
 from dataclasses import dataclass
 
+from cachetools import LRUCache
 from langchain_core.language_models import BaseChatModel
 
 from agents.model_registry import get_default_model, get_model
@@ -33,6 +37,16 @@ _PROVIDER_KEY_KWARG: dict[str, str] = {
     "anthropic": "anthropic_api_key",
 }
 
+# Chat models are stateless HTTP clients, so sessions asking for the same
+# model, key and thinking config share one instance. That reuses the
+# provider's connection pool and keeps object identity stable, so the
+# compiled-workflow cache in analyst_graph hits across WebSocket sessions
+# instead of only within one. API keys are hashed before use as a key.
+LLM_INSTANCE_CACHE_SIZE = int(os.getenv("LLM_INSTANCE_CACHE_SIZE", "32"))
+
+_llm_instances: LRUCache = LRUCache(maxsize=LLM_INSTANCE_CACHE_SIZE)
+_llm_instances_lock = threading.Lock()
+
 # Thinking budget tiers for Anthropic (token counts per level)
 _ANTHROPIC_THINKING_BUDGETS: dict[str, int] = {
     "low": 1024,
@@ -98,7 +112,8 @@ def create_llm(
             isn't thinking-capable.
 
     Returns:
-        A BaseChatModel instance ready for use with LangGraph.
+        A BaseChatModel instance ready for use with LangGraph. Instances are
+        shared between callers with the same model, key and thinking config.
     """
     from langchain.chat_models import init_chat_model
 
@@ -116,15 +131,34 @@ def create_llm(
     effective_thinking = thinking if model.thinking_capable else None
     thinking_kwargs = _build_thinking_kwargs(model.provider, model.id, effective_thinking)
 
+    cache_key = (
+        model.id,
+        hashlib.sha256(api_key.encode("utf-8")).hexdigest(),
+        effective_thinking if effective_thinking and effective_thinking.enabled else None,
+    )
+    with _llm_instances_lock:
+        cached = _llm_instances.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Resolve the provider-specific API key kwarg name
     key_kwarg_name = _PROVIDER_KEY_KWARG.get(model.provider, "api_key")
 
-    return init_chat_model(
+    llm = init_chat_model(
         f"{model.provider}:{model.id}",
         temperature=0,
         **{key_kwarg_name: api_key},
         **thinking_kwargs,
     )
+    # Two racing first requests may both build; the first stored one wins.
+    with _llm_instances_lock:
+        return _llm_instances.setdefault(cache_key, llm)
+
+
+def clear_llm_instance_cache() -> None:
+    """Drop every shared chat-model instance (tests, key rotation)."""
+    with _llm_instances_lock:
+        _llm_instances.clear()
 
 
 def create_llm_pair(
@@ -1,11 +1,15 @@
 """Query planner for decomposing complex financial analysis queries into executable steps."""
 
 import os
-from typing import List, Literal
+import re
+from string import Formatter
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 from langchain_core.language_models.chat_models import BaseChatModel
 
+from agents.llm_cache import get_cached_response, make_cache_key, set_cached_response
 from agents.prompts import (
+    QUERY_ASSESSMENT_PROMPT,
     QUERY_PLANNER_SYSTEM_PROMPT,
     QUERY_CLASSIFIER_PROMPT,
     TOOL_CAPABILITIES,
@@ -17,6 +21,76 @@ from agents.prompts import (
 # calls). Env-overridable for power users.
 MAX_PLAN_STEPS = int(os.getenv("MAX_PLAN_STEPS", "15"))
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT = "?!.,;: "
+
+
+# Deterministic pre-filter for single-metric lookups ("What is AAPL's P/E?").
+# These are always one ReAct tool call, so the router can skip the LLM
+# classification round-trip. Deliberately narrow: anything with a second
+# intent or analytical wording falls through to the LLM classifier.
+SIMPLE_LOOKUP_MAX_WORDS = int(os.getenv("SIMPLE_LOOKUP_MAX_WORDS", "10"))
+
+_SIMPLE_METRIC_RE = re.compile(
+    r"\b(?:"
+    r"(?:stock |share |current )?price"
+    r"|p\s*/\s*e(?: ratio)?|pe ratio|price[- ]to[- ]earnings"
+    r"|market cap(?:italization)?"
+    r"|dividends?(?: yield)?"
+    r"|52[- ]week (?:high|low)"
+    r"|eps|beta|rsi|macd|volume"
+    r")\b",
+    re.IGNORECASE,
+)
+_MULTI_INTENT_RE = re.compile(
+    r"[,;&]|\b(?:and|also|plus|compare\w*|vs\.?|versus|analy[sz]\w*|risk\w*"
+    r"|should|why|trend\w*|outlook|forecast|histor\w*|news|filing\w*"
+    r"|10-[kq]|8-k)\b",
+    re.IGNORECASE,
+)
+
+
+def is_simple_lookup(query: str) -> bool:
+    """True if `query` is a short, single-metric lookup the router can send
+    straight to the ReAct agent without LLM classification."""
+    if len(query.split()) > SIMPLE_LOOKUP_MAX_WORDS:
+        return False
+    return bool(_SIMPLE_METRIC_RE.search(query)) and not _MULTI_INTENT_RE.search(query)
+
+
+def _bind_template(template: str, **values: str) -> str:
+    """Substitute `values` into `template`, leaving other fields formattable.
+
+    Literal braces in the bound values and in the template text are
+    re-escaped, so the result can still be `.format()`-ed for the
+    remaining fields.
+    """
+    def _escape(text: str) -> str:
+        return text.replace("{", "{{").replace("}", "}}")
+
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        parts.append(_escape(literal))
+        if field is None:
+            continue
+        if field in values:
+            parts.append(_escape(format(values[field], spec or "")))
+        else:
+            parts.append(
+                "{" + field + (f"!{conversion}" if conversion else "")
+                + (f":{spec}" if spec else "") + "}"
+            )
+    return "".join(parts)
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse surface differences that can't change a classification or plan.
+
+    "What's AAPL's P/E?" and "  what's aapl's p/e  " share a cache entry.
+    Inner punctuation is kept — "P/E", "10-K" and "8-K" carry meaning.
+    """
+    return _WHITESPACE_RE.sub(" ", query.casefold()).strip(_TRAILING_PUNCT)
+
 
 class AnalysisStep(BaseModel):
     """A single step in an analysis plan."""
@@ -69,6 +143,18 @@ class QueryPlan(BaseModel):
     )
 
 
+class QueryAssessment(BaseModel):
+    """Classification plus (for multi-tool queries) the plan, from one LLM call."""
+
+    classification: QueryClassification = Field(
+        description="Complexity classification of the query"
+    )
+    plan: Optional[QueryPlan] = Field(
+        default=None,
+        description="Execution plan. Omit for simple single-tool queries and unclear messages.",
+    )
+
+
 class QueryPlanner:
     """Plans and decomposes complex financial analysis queries."""
 
@@ -78,6 +164,41 @@ class QueryPlanner:
         self.has_research_tools = has_research_tools
         self.plan_llm = llm.with_structured_output(QueryPlan)
         self.classify_llm = llm.with_structured_output(QueryClassification)
+        self.assess_llm = llm.with_structured_output(QueryAssessment)
+
+        # Ticker, tool list and research note are fixed per planner; bind
+        # them once so each call only formats `{query}`.
+        if has_research_tools:
+            classify_note = "Research tools ARE available (web search, news, competitors, trends)."
+            plan_note = (
+                "Research tools (web_search, deep_research, get_company_news, "
+                "analyze_competitors, get_industry_trends) ARE available."
+            )
+        else:
+            classify_note = "Research tools are NOT available."
+            plan_note = "Research tools are NOT available. Only use SEC and stock market tools."
+        bound = {"ticker": ticker, "tool_capabilities": TOOL_CAPABILITIES}
+        self._classify_template = _bind_template(
+            QUERY_CLASSIFIER_PROMPT, research_note=classify_note, **bound
+        )
+        self._plan_template = _bind_template(
+            QUERY_PLANNER_SYSTEM_PROMPT, research_note=plan_note, **bound
+        )
+        self._assess_template = _bind_template(
+            QUERY_ASSESSMENT_PROMPT, research_note=plan_note, **bound
+        )
+
+    def _cache_key(self, namespace: str, query: str) -> str:
+        """Key a planner LLM call on its inputs, with the query normalized.
+
+        The prompt templates are fixed per process, so (ticker, research
+        availability, normalized query) identifies the rendered prompt.
+        """
+        return make_cache_key(
+            namespace,
+            self.llm,
+            f"{self.ticker}\x00{self.has_research_tools}\x00{_normalize_query(query)}",
+        )
 
     def classify_query(self, query: str) -> QueryClassification:
         """
@@ -85,20 +206,17 @@ class QueryPlanner:
 
         Returns classification with complexity level, reasoning, and estimated tools.
         """
-        research_note = (
-            "Research tools ARE available (web search, news, competitors, trends)."
-            if self.has_research_tools
-            else "Research tools are NOT available."
-        )
+        key = self._cache_key("classify", query)
+        cached = get_cached_response(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
 
-        prompt = QUERY_CLASSIFIER_PROMPT.format(
-            ticker=self.ticker,
-            tool_capabilities=TOOL_CAPABILITIES,
-            research_note=research_note,
-            query=query,
-        )
+        prompt = self._classify_template.format(query=query)
 
-        return self.classify_llm.invoke(prompt)
+        classification = self.classify_llm.invoke(prompt)
+        if classification is not None:
+            set_cached_response(key, classification.model_copy(deep=True))
+        return classification
 
     def create_plan(self, query: str) -> QueryPlan:
         """
@@ -107,23 +225,42 @@ class QueryPlanner:
         For simple queries (single tool needed), returns a minimal plan.
         For complex queries, decomposes into multiple steps.
         """
-        research_note = (
-            "Research tools (web_search, deep_research, get_company_news, "
-            "analyze_competitors, get_industry_trends) ARE available."
-            if self.has_research_tools
-            else "Research tools are NOT available. Only use SEC and stock market tools."
-        )
+        key = self._cache_key("plan", query)
+        cached = get_cached_response(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
 
-        prompt = QUERY_PLANNER_SYSTEM_PROMPT.format(
-            ticker=self.ticker,
-            tool_capabilities=TOOL_CAPABILITIES,
-            research_note=research_note,
-            query=query,
-        )
+        prompt = self._plan_template.format(query=query)
 
         plan = self.plan_llm.invoke(prompt)
+        if plan is not None:
+            set_cached_response(key, plan.model_copy(deep=True))
         return plan
 
+    def classify_and_plan(
+        self, query: str
+    ) -> tuple[QueryClassification, Optional[QueryPlan]]:
+        """
+        Classify a query and plan it in a single LLM call.
+
+        The router uses this so complex queries don't pay a second sequential
+        round-trip in the planner node. The plan is None for simple and
+        unclear queries, or whenever the model leaves it out — callers fall
+        back to create_plan() in that case.
+        """
+        key = self._cache_key("assess", query)
+        cached = get_cached_response(key)
+        if cached is None:
+            prompt = self._assess_template.format(query=query)
+
+            cached = self.assess_llm.invoke(prompt)
+            if cached is None:
+                return None, None
+            set_cached_response(key, cached.model_copy(deep=True))
+
+        assessment = cached.model_copy(deep=True)
+        return assessment.classification, assessment.plan
+
     def should_plan(self, query: str) -> tuple[bool, QueryClassification]:
         """
         Determine if a query needs multi-step planning.
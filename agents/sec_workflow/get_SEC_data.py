@@ -1,8 +1,47 @@
 from edgar import Company, CompanyNotFoundError
-import json
-from typing import Literal, Optional, Dict, Any
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Literal, Optional
 from datetime import datetime
 
+import orjson
+import pandas as pd
+from cachetools import LRUCache, TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Concurrent EDGAR fetches per prefetch() call. SEC's fair-access limit is
+# 10 req/s per client; three in flight (10-K, 10-Q, 8-K) stays well under it.
+SEC_PREFETCH_WORKERS = int(os.getenv("SEC_PREFETCH_WORKERS", "3"))
+
+# Process-wide filing caches shared by every SECDataRetrieval — the filings
+# endpoint builds a fresh retriever per request, so per-instance caches alone
+# re-download the same documents for every viewer of a ticker.
+# "Latest 10-Q" changes when a new one is filed, so lookups expire (15 min,
+# the briefing/LLM cache convention). Parsed documents are keyed by accession
+# number, whose content never changes, so they only need a size bound —
+# a parsed 10-K can run to several MB.
+SEC_LATEST_FILING_TTL_SECONDS = float(os.getenv("SEC_LATEST_FILING_TTL_SECONDS", "900"))
+SEC_PARSED_FILING_CACHE_SIZE = int(os.getenv("SEC_PARSED_FILING_CACHE_SIZE", "32"))
+
+_latest_filings: TTLCache = TTLCache(maxsize=512, ttl=SEC_LATEST_FILING_TTL_SECONDS)
+_parsed_filings: LRUCache = LRUCache(maxsize=SEC_PARSED_FILING_CACHE_SIZE)
+
+# prefetch() fills both caches from worker threads; cachetools isn't thread-safe.
+_filing_cache_lock = threading.Lock()
+
+# On-disk cache of extracted output, one directory per (ticker, accession):
+# MD&A and risk-factor text plus the split-orient balance-sheet JSON. Unlike
+# the in-process caches above it survives restarts, so a cold process serves
+# a known filing without downloading or parsing it. An accession's content
+# never changes, so entries don't expire and the directory grows with every
+# filing viewed — off unless SEC_CACHE_DIR is set, like SEC_LOCAL_DATA_DIR.
+# Delete the directory (or one accession's folder) to rebuild entries.
+SEC_CACHE_DIR = (os.getenv("SEC_CACHE_DIR") or "").strip()
+
 # Item code → edgartools __getitem__ key for each form.
 # 10-K: items are unique across all parts; keys are "Item X" strings.
 # 10-Q: installed edgartools 3.x resolves via chunked_document, so bare
@@ -25,9 +64,94 @@ _TENQ_ITEM_KEYS: Dict[str, str] = {
     "5":  "Item 5",   # Other Information (Part II — insider trading etc.)
 }
 
+# 20-F: TwentyF exposes sections as named properties rather than item keys;
+# map the 10-K item codes callers already use onto those accessors.
+_TWENTYF_ACCESSORS: Dict[str, str] = {
+    "1A": "risk_factors",
+    "7":  "management_discussion",
+    "1":  "business",
+}
+
+
+# `which` spellings accepted by the balance-sheet extractors (legacy tenk/tenq
+# and form names).
+_TENK_ALIASES = frozenset({"tenk", "both", "10-K"})
+_TENQ_ALIASES = frozenset({"tenq", "both", "10-Q"})
+
+
+def _frame_to_split_dict(df: pd.DataFrame) -> Dict[str, Any]:
+    """DataFrame → JSON-safe ``orient="split"`` dict (NaN/NaT as None).
+
+    Deliberately *not* ``df.to_dict(orient="split")``: that boxes every cell in
+    Python, keeps NaN/Timestamp values that aren't JSON-serializable, and on a
+    typical 60x10 XBRL statement is ~2x slower than pandas' C ``to_json``
+    followed by orjson's parse.
+    """
+    return orjson.loads(df.to_json(orient="split"))
+
+
+def _latest_filing(ticker: str, form: str, lookup: Callable[[], Any]) -> Any:
+    """Latest ``form`` filing for ``ticker``, shared across retrievers.
+
+    Misses are not cached, so a company that files later is picked up.
+    """
+    key = (ticker.upper(), form)
+    with _filing_cache_lock:
+        filing = _latest_filings.get(key)
+    if filing is None:
+        filing = lookup()
+        if filing is not None:
+            with _filing_cache_lock:
+                _latest_filings[key] = filing
+    return filing
+
+
+def _parsed_filing(filing: Any) -> Any:
+    """``filing.obj()``, parsed once per accession number per process."""
+    key = filing.accession_number
+    with _filing_cache_lock:
+        obj = _parsed_filings.get(key)
+    if obj is None:
+        obj = filing.obj()
+        if obj is not None:
+            with _filing_cache_lock:
+                _parsed_filings[key] = obj
+    return obj
+
+
+def _write_cache_file(path: Path, text: str) -> None:
+    """Write ``text`` atomically so concurrent readers never see a partial file.
+
+    Failures are logged, not raised — the caller already has the value.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Could not write SEC cache file %s: %s", path, e)
+
+
+def clear_filing_caches() -> None:
+    """Drop the shared filing lookups and parsed documents (tests, refresh)."""
+    with _filing_cache_lock:
+        _latest_filings.clear()
+        _parsed_filings.clear()
+
 
 class FilingMetadata:
-    """Metadata for SEC filings to track provenance."""
+    """Metadata for SEC filings to track provenance.
+
+    Fields are fixed once the filing is looked up, so the dict form is built
+    at construction; ``to_dict`` hands out copies because callers merge extra
+    keys (edgar_url, form_type) into the result.
+    """
+
+    __slots__ = (
+        "form", "cik", "accession", "filing_date", "period_of_report",
+        "company_name", "_as_dict",
+    )
 
     def __init__(
         self,
@@ -44,16 +168,17 @@ class FilingMetadata:
         self.filing_date = filing_date
         self.period_of_report = period_of_report
         self.company_name = company_name
+        self._as_dict: Dict[str, str] = {
+            "form": form,
+            "cik": cik,
+            "accession": accession,
+            "filing_date": filing_date,
+            "period_of_report": period_of_report,
+            "company_name": company_name,
+        }
 
     def to_dict(self) -> Dict[str, str]:
-        return {
-            "form": self.form,
-            "cik": self.cik,
-            "accession": self.accession,
-            "filing_date": self.filing_date,
-            "period_of_report": self.period_of_report,
-            "company_name": self.company_name,
-        }
+        return dict(self._as_dict)
 
     def __str__(self) -> str:
         if self.form == "10-K":
@@ -89,6 +214,13 @@ class SECDataRetrieval:
         self._tenq_metadata = None
         self._eightk_metadata = None
         self._twentyf_metadata = None
+        # form → balance sheet DataFrame; rebuilding it from XBRL is the
+        # costliest non-network step, and the str/json extractors share it.
+        self._balance_sheet_dfs: Dict[str, pd.DataFrame] = {}
+        # (form, item) → found section. Rendering a section's text walks the
+        # filing's HTML; chat tools and the filings endpoint share this
+        # retriever and ask for the same sections repeatedly.
+        self._section_cache: Dict[tuple, Dict[str, Any]] = {}
 
     def check_filing_availability(self) -> Dict[str, Any]:
         """Check what filings are available for this company.
@@ -109,28 +241,54 @@ class SECDataRetrieval:
             result["is_foreign"] = self.company.is_foreign
         except Exception:
             pass
-        try:
-            filing_10k = self.company.latest(form="10-K")
-            result["has_10k"] = filing_10k is not None
-        except Exception:
-            pass
-        try:
-            filing_10q = self.company.latest(form="10-Q")
-            result["has_10q"] = filing_10q is not None
-        except Exception:
-            pass
-        try:
-            filing_8k = self.company.get_filings(form="8-K").latest(1)
-            result["has_8k"] = filing_8k is not None
-        except Exception:
-            pass
-        try:
-            filing_20f = self.company.latest(form="20-F")
-            result["has_20f"] = filing_20f is not None
-        except Exception:
-            pass
+        # The four lookups are independent EDGAR round-trips; run them side by
+        # side. They go through the lazy filing getters, so later calls that
+        # need the same filing (and its metadata) skip the lookup entirely.
+        forms = ("10-K", "10-Q", "8-K", "20-F")
+        self.prefetch(forms, metadata_only=forms)
+        result["has_10k"] = self._tenk_filing is not None
+        result["has_10q"] = self._tenq_filing is not None
+        result["has_8k"] = self._eightk_filing is not None
+        result["has_20f"] = self._twentyf_filing is not None
         return result
 
+    # form → (filing getter, parsed-object getter) used by prefetch(). Each
+    # pair only touches that form's own lazy-cache attributes.
+    _PREFETCH_GETTERS = {
+        "10-K": ("get_tenk_filing", "get_tenk"),
+        "10-Q": ("get_tenq_filing", "get_tenq"),
+        "8-K": ("get_eightk_filing", "get_eightk"),
+        "20-F": ("get_twentyf_filing", "get_twentyf"),
+    }
+
+    def prefetch(
+        self,
+        forms: Iterable[str] = ("10-K", "10-Q", "8-K"),
+        metadata_only: Iterable[str] = (),
+    ) -> None:
+        """Warm the lazy caches for several forms concurrently.
+
+        Each form's lookup and document download is independent I/O against
+        EDGAR, so callers that need several filings pay for the slowest one
+        instead of the sum. Forms listed in ``metadata_only`` stop at the
+        filing lookup instead of downloading and parsing the document.
+        Failures are swallowed here — the lazy getters raise them again for
+        whichever caller actually needs that form.
+        """
+        lookup_only = set(metadata_only)
+        getters = [
+            getattr(self, self._PREFETCH_GETTERS[f][0 if f in lookup_only else 1])
+            for f in forms
+        ]
+        if not getters:
+            return
+        with ThreadPoolExecutor(max_workers=min(len(getters), SEC_PREFETCH_WORKERS)) as pool:
+            for future in [pool.submit(getter) for getter in getters]:
+                try:
+                    future.result()
+                except Exception:
+                    pass
+
     # Lazy getters for filings (EntityFiling objects)
     def get_tenk_filing(self):
         if self._tenk_filing is None:
@@ -150,15 +308,96 @@ class SECDataRetrieval:
     def get_tenk(self):
         if self._tenk_obj is None:
             filing = self.get_tenk_filing()
-            self._tenk_obj = filing.obj()
+            self._tenk_obj = _parsed_filing(filing)
         return self._tenk_obj
 
     def get_tenq(self):
         if self._tenq_obj is None:
             filing = self.get_tenq_filing()
-            self._tenq_obj = filing.obj()
+            self._tenq_obj = _parsed_filing(filing)
         return self._tenq_obj
 
+    def get_balance_sheet_df(self, form: Literal["10-K", "10-Q"]) -> pd.DataFrame:
+        df = self._balance_sheet_dfs.get(form)
+        if df is None:
+            obj = self.get_tenk() if form == "10-K" else self.get_tenq()
+            df = obj.financials.balance_sheet().to_dataframe()
+            self._balance_sheet_dfs[form] = df
+        return df
+
+    def _prefetch_balance_sheet_filings(self) -> None:
+        """Overlap the 10-K and 10-Q downloads when both statements are needed.
+
+        Statements already in the on-disk cache only need the filing lookup
+        (for the accession), so those documents aren't downloaded.
+        """
+        forms = ("10-K", "10-Q")
+        if any(form in self._balance_sheet_dfs for form in forms):
+            return
+        if SEC_CACHE_DIR:
+            self.prefetch(forms, metadata_only=forms)
+            forms = tuple(
+                form for form in forms
+                if self._read_disk_cache(form, "balance_sheet.json") is None
+            )
+        if len(forms) == 2:
+            self.prefetch(forms)
+
+    def _disk_cache_path(self, form: Literal["10-K", "10-Q"], name: str) -> Optional[Path]:
+        """``SEC_CACHE_DIR/<TICKER>/<accession>/<name>`` for the latest ``form``.
+
+        None when the cache is disabled or the filing lookup fails — the
+        extractor then goes to the document and reports the failure itself.
+        """
+        if not SEC_CACHE_DIR:
+            return None
+        try:
+            filing = self.get_tenk_filing() if form == "10-K" else self.get_tenq_filing()
+        except Exception:
+            return None
+        accession = getattr(filing, "accession_number", None)
+        if not isinstance(accession, str):
+            return None
+        return Path(SEC_CACHE_DIR).expanduser() / self.ticker.upper() / accession / name
+
+    def _read_disk_cache(self, form: Literal["10-K", "10-Q"], name: str) -> Optional[str]:
+        path = self._disk_cache_path(form, name)
+        if path is None:
+            return None
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Could not read SEC cache file %s: %s", path, e)
+            return None
+
+    def _write_disk_cache(self, form: Literal["10-K", "10-Q"], name: str, text: str) -> None:
+        path = self._disk_cache_path(form, name)
+        if path is not None:
+            _write_cache_file(path, text)
+
+    def _cached_section_text(self, form: Literal["10-K", "10-Q"], item: str, name: str) -> str:
+        """Section text from the on-disk cache, else ``get_section``.
+
+        Only found sections are written, so a miss or error is retried later.
+        """
+        text = self._read_disk_cache(form, name)
+        if text is None:
+            result = self.get_section(form, item)
+            text = result["text"]
+            if result["found"]:
+                self._write_disk_cache(form, name, text)
+        return text
+
+    def _balance_sheet_json(self, form: Literal["10-K", "10-Q"]) -> str:
+        """Balance sheet as split JSON text, from the on-disk cache if present."""
+        text = self._read_disk_cache(form, "balance_sheet.json")
+        if text is None:
+            text = self.get_balance_sheet_df(form).to_json(orient="split")
+            self._write_disk_cache(form, "balance_sheet.json", text)
+        return text
+
     def get_eightk_filing(self):
         if self._eightk_filing is None:
             self._eightk_filing = self._fetch_latest_eightk_filing()
@@ -169,7 +408,7 @@ class SECDataRetrieval:
     def get_eightk(self):
         if self._eightk_obj is None:
             filing = self.get_eightk_filing()
-            self._eightk_obj = filing.obj()
+            self._eightk_obj = _parsed_filing(filing)
         return self._eightk_obj
 
     def get_twentyf_filing(self):
@@ -188,16 +427,16 @@ class SECDataRetrieval:
         """
         if self._twentyf_obj is None:
             filing = self.get_twentyf_filing()
-            self._twentyf_obj = filing.obj()
+            self._twentyf_obj = _parsed_filing(filing)
         return self._twentyf_obj
 
     # Private fetchers
     def _fetch_company_tenk_filing(self):
-        filing = self.company.latest(form="10-K")
+        filing = _latest_filing(self.ticker, "10-K", lambda: self.company.latest(form="10-K"))
         if filing is None:
-            print(f"No 10-K filing found for {self.company.name}")
+            logger.info("No 10-K filing found for %s", self.company.name)
             return None
-        print("10-K filing found")
+        logger.debug("10-K filing found for %s", self.company.name)
 
         # Extract metadata from the filing (EntityFiling object)
         self._tenk_metadata = FilingMetadata(
@@ -211,11 +450,11 @@ class SECDataRetrieval:
         return filing
 
     def _fetch_company_tenq_filing(self):
-        filing = self.company.latest(form="10-Q")
+        filing = _latest_filing(self.ticker, "10-Q", lambda: self.company.latest(form="10-Q"))
         if filing is None:
-            print(f"No 10-Q filing found for {self.company.name}")
+            logger.info("No 10-Q filing found for %s", self.company.name)
             return None
-        print("10-Q filing found")
+        logger.debug("10-Q filing found for %s", self.company.name)
 
         # Extract metadata from the filing (EntityFiling object)
         self._tenq_metadata = FilingMetadata(
@@ -229,11 +468,11 @@ class SECDataRetrieval:
         return filing
 
     def _fetch_company_twentyf_filing(self):
-        filing = self.company.latest(form="20-F")
+        filing = _latest_filing(self.ticker, "20-F", lambda: self.company.latest(form="20-F"))
         if filing is None:
-            print(f"No 20-F filing found for {self.company.name}")
+            logger.info("No 20-F filing found for %s", self.company.name)
             return None
-        print("20-F filing found")
+        logger.debug("20-F filing found for %s", self.company.name)
 
         self._twentyf_metadata = FilingMetadata(
             form=filing.form,
@@ -246,11 +485,13 @@ class SECDataRetrieval:
         return filing
 
     def _fetch_latest_eightk_filing(self):
-        filing = self.company.get_filings(form="8-K").latest(1)
+        filing = _latest_filing(
+            self.ticker, "8-K", lambda: self.company.get_filings(form="8-K").latest(1)
+        )
         if filing is None:
-            print(f"No 8-K filing found for {self.company.name}")
+            logger.info("No 8-K filing found for %s", self.company.name)
             return None
-        print("8-K filing found")
+        logger.debug("8-K filing found for %s", self.company.name)
 
         self._eightk_metadata = FilingMetadata(
             form=filing.form,
@@ -335,16 +576,16 @@ class SECDataRetrieval:
 
             # Each financial table is optional — some press releases omit them
             if earnings.income_statement:
-                result["income_statement"] = json.loads(
-                    earnings.income_statement.dataframe.to_json(orient="split")
+                result["income_statement"] = _frame_to_split_dict(
+                    earnings.income_statement.dataframe
                 )
             if earnings.balance_sheet:
-                result["balance_sheet"] = json.loads(
-                    earnings.balance_sheet.dataframe.to_json(orient="split")
+                result["balance_sheet"] = _frame_to_split_dict(
+                    earnings.balance_sheet.dataframe
                 )
             if earnings.cash_flow_statement:
-                result["cash_flow"] = json.loads(
-                    earnings.cash_flow_statement.dataframe.to_json(orient="split")
+                result["cash_flow"] = _frame_to_split_dict(
+                    earnings.cash_flow_statement.dataframe
                 )
 
             return result
@@ -365,10 +606,19 @@ class SECDataRetrieval:
                 "4" controls, "5" other information
           20-F: "1A" risk factors (via .risk_factors),
                 "7" MD&A (via .management_discussion)
+
+        Found sections are memoized per instance; misses and errors are not,
+        so a transient failure is retried on the next call.
         """
+        cached = self._section_cache.get((form, item))
+        if cached is not None:
+            return {**cached, "metadata": dict(cached["metadata"])}
         try:
             if form == "20-F":
-                return self._get_twentyf_section(item)
+                result = self._get_twentyf_section(item)
+                if result.get("found"):
+                    self._section_cache[(form, item)] = {**result, "metadata": dict(result["metadata"])}
+                return result
             elif form == "10-K":
                 filing_obj = self.get_tenk()
                 metadata = self._tenk_metadata
@@ -390,11 +640,14 @@ class SECDataRetrieval:
             if not found:
                 text = f"Section {key} not found in {form} filing"
 
-            return {
+            result = {
                 "text": str(text) if text else "",
                 "metadata": metadata.to_dict() if metadata else {},
                 "found": found,
             }
+            if found:
+                self._section_cache[(form, item)] = {**result, "metadata": dict(result["metadata"])}
+            return result
 
         except Exception as e:
             return {"text": f"Error extracting {item} from {form}: {e}", "metadata": {}, "found": False}
@@ -407,14 +660,7 @@ class SECDataRetrieval:
         10-K (e.g., "1A" for risk factors, "7" for MD&A) to the
         corresponding TwentyF properties.
         """
-        # Map 10-K item codes to TwentyF named properties
-        _TWENTYF_ACCESSOR_MAP = {
-            "1A": "risk_factors",
-            "7": "management_discussion",
-            "1": "business",
-        }
-
-        accessor = _TWENTYF_ACCESSOR_MAP.get(item)
+        accessor = _TWENTYF_ACCESSORS.get(item)
         if accessor is None:
             return {
                 "text": f"Item '{item}' not supported for 20-F",
@@ -477,7 +723,7 @@ class SECDataRetrieval:
             stmt = obj.financials.income_statement()
             if stmt is None:
                 return None
-            return json.loads(stmt.to_dataframe().to_json(orient="split"))
+            return _frame_to_split_dict(stmt.to_dataframe())
         except Exception:
             return None
 
@@ -492,49 +738,48 @@ class SECDataRetrieval:
             stmt = obj.financials.cashflow_statement()
             if stmt is None:
                 return None
-            return json.loads(stmt.to_dataframe().to_json(orient="split"))
+            return _frame_to_split_dict(stmt.to_dataframe())
         except Exception:
             return None
 
     # Legacy methods for backward compatibility (updated to be form-aware)
     def extract_risk_factors(self, form: Literal["10-K", "10-Q"] = "10-K") -> str:
         """Extract risk factors from specified filing form."""
-        print(f"Extracting risk factors from {form}")
-        result = self.get_section(form, "1A")
-        return result["text"]
+        logger.debug("Extracting risk factors from %s", form)
+        return self._cached_section_text(form, "1A", "risk_factors.txt")
 
     def extract_management_discussion(
         self, form: Literal["10-K", "10-Q"] = "10-K"
     ) -> str:
         """Extract management discussion from specified filing form."""
-        print(f"Extracting management discussion from {form}")
-        if form == "10-K":
-            result = self.get_section(form, "7")
-        else:  # 10-Q
-            result = self.get_section(form, "2")
-        return result["text"]
+        logger.debug("Extracting management discussion from %s", form)
+        item = "7" if form == "10-K" else "2"
+        return self._cached_section_text(form, item, "mda.txt")
 
     def extract_balance_sheet_as_str(
         self, which: Literal["tenk", "tenq", "both", "10-K", "10-Q"] = "both"
     ) -> dict[str, str]:
-        print("Extracting balance sheet as string")
+        """Balance sheets as compact ``orient="split"`` JSON strings for prompts.
+
+        ``to_string()`` pads every cell with whitespace to align columns, which
+        costs LLM tokens for no information; split JSON names each column once
+        and carries the values unpadded. Unlike ``extract_balance_sheet_as_json``
+        there is no parse round-trip — callers only embed the text.
+        """
+        logger.debug("Extracting balance sheet as string")
         out: dict[str, str] = {}
 
         # Handle both old and new parameter formats
-        include_tenk = which in ("tenk", "both", "10-K")
-        include_tenq = which in ("tenq", "both", "10-Q")
+        include_tenk = which in _TENK_ALIASES
+        include_tenq = which in _TENQ_ALIASES
+        if include_tenk and include_tenq:
+            self._prefetch_balance_sheet_filings()
 
         if include_tenk:
-            tenk = self.get_tenk()
-            out["tenk"] = (
-                tenk.financials.balance_sheet().to_dataframe().to_string()
-            )
+            out["tenk"] = self._balance_sheet_json("10-K")
         if include_tenq:
             try:
-                tenq = self.get_tenq()
-                out["tenq"] = (
-                    tenq.financials.balance_sheet().to_dataframe().to_string()
-                )
+                out["tenq"] = self._balance_sheet_json("10-Q")
             except Exception as e:
                 out["tenq_error"] = str(e)
         return out
@@ -546,32 +791,24 @@ class SECDataRetrieval:
         Extract balance sheets from 10-K and/or 10-Q filings and convert to JSON-serializable format.
         Includes filing metadata for provenance.
         """
-        print("Extracting balance sheet as JSON")
+        logger.debug("Extracting balance sheet as JSON")
         out: dict[str, Optional[dict]] = {}
 
         # Handle both old and new parameter formats
-        include_tenk = which in ("tenk", "both", "10-K")
-        include_tenq = which in ("tenq", "both", "10-Q")
+        include_tenk = which in _TENK_ALIASES
+        include_tenq = which in _TENQ_ALIASES
+        if include_tenk and include_tenq:
+            self._prefetch_balance_sheet_filings()
 
         if include_tenk:
-            tenk = self.get_tenk()
-            out["tenk"] = json.loads(
-                tenk.financials.balance_sheet()
-                .to_dataframe()
-                .to_json(orient="split")
-            )
+            out["tenk"] = orjson.loads(self._balance_sheet_json("10-K"))
             # Add metadata for provenance
             if self._tenk_metadata:
                 out["tenk_metadata"] = self._tenk_metadata.to_dict()
 
         if include_tenq:
             try:
-                tenq = self.get_tenq()
-                out["tenq"] = json.loads(
-                    tenq.financials.balance_sheet()
-                    .to_dataframe()
-                    .to_json(orient="split")
-                )
+                out["tenq"] = orjson.loads(self._balance_sheet_json("10-Q"))
                 # Add metadata for provenance
                 if self._tenq_metadata:
                     out["tenq_metadata"] = self._tenq_metadata.to_dict()
@@ -1,3 +1,6 @@
+import functools
+import logging
+import os
 from typing import List, Optional, Dict, Any
 
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -30,6 +33,70 @@ from agents.prompts import (
     CASH_FLOW_USER_TEMPLATE,
 )
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on filing-section text sent in one analysis prompt. Most MD&A
+# and risk-factor sections fit comfortably; the outliers (100+ page 10-K risk
+# sections) would otherwise dominate request latency and cost. Tokens are
+# estimated at 4 chars each — the same heuristic as api/memory.estimate_tokens
+# — because the analyzer runs against Gemini, OpenAI and Anthropic models
+# that don't share a tokenizer.
+SEC_SECTION_MAX_TOKENS = int(os.getenv("SEC_SECTION_MAX_TOKENS", "24000"))
+_CHARS_PER_TOKEN = 4
+
+# Share of the budget kept from the start of an over-long section; the rest
+# comes from its end. Openings carry the overview, while MD&A outlook and
+# liquidity discussion and the last risk factors sit at the end.
+_TRUNCATION_HEAD_SHARE = 0.75
+
+_TRUNCATION_MARKER = "\n\n[... middle of section omitted for length ...]\n\n"
+
+
+def _truncate_section_text(text: str, max_tokens: Optional[int] = None) -> str:
+    """Cap section text at ~max_tokens, keeping its head and tail.
+
+    Both cuts land on a line boundary when one is close enough, so the
+    model never sees a half sentence at the seam.
+    """
+    limit = (max_tokens or SEC_SECTION_MAX_TOKENS) * _CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    head_budget = int(limit * _TRUNCATION_HEAD_SHARE)
+    tail_budget = limit - head_budget
+
+    head_end = text.rfind("\n", 0, head_budget)
+    if head_end < head_budget // 2:
+        head_end = head_budget
+
+    tail_floor = len(text) - tail_budget
+    tail_start = text.find("\n", tail_floor, tail_floor + tail_budget // 2)
+    tail_start = tail_floor if tail_start == -1 else tail_start + 1
+
+    return text[:head_end] + _TRUNCATION_MARKER + text[tail_start:]
+
+
+@functools.cache
+def _format_instructions(schema: type[BaseModel]) -> str:
+    """Format instructions for ``schema``, rendered once per process.
+
+    ``get_format_instructions()`` walks the model's JSON schema and re-dumps it
+    on every call; the output only depends on the model class.
+    """
+    return PydanticOutputParser(pydantic_object=schema).get_format_instructions()
+
+
+@functools.cache
+def _section_template(system_prompt: str, user_template: str) -> ChatPromptTemplate:
+    """Parsed (system, user) prompt pair, built once per section type.
+
+    ``.partial()`` returns a copy, so callers binding per-filing values never
+    mutate the shared template.
+    """
+    return ChatPromptTemplate.from_messages([
+        ("system", system_prompt),
+        ("user", user_template),
+    ])
+
 
 # Pydantic models for structured output
 class SentimentAnalysis(BaseModel):
@@ -227,7 +294,12 @@ class CashFlowAnalysis(BaseModel):
 
 
 class SECDocumentProcessor:
-    """Processes SEC documents using LLM."""
+    """Processes SEC documents using LLM.
+
+    When a chain fails, each ``analyze_*`` method returns a placeholder built
+    with ``model_construct``. The placeholder values are static, and skipping
+    validation means odd filing metadata can't make the error path raise too.
+    """
 
     def __init__(self, llm: BaseChatModel):
         """Initialize with OpenAI API key."""
@@ -249,64 +321,46 @@ class SECDocumentProcessor:
         self.income_statement_parser = PydanticOutputParser(pydantic_object=IncomeStatementAnalysis)
         self.cash_flow_parser = PydanticOutputParser(pydantic_object=CashFlowAnalysis)
 
-    def generate_mda_prompt(
-        self, ticker: str, mda_data: Dict[str, Any]
+    def _form_section_prompt(
+        self,
+        system_prompt: str,
+        user_template: str,
+        parser: PydanticOutputParser,
+        ticker: str,
+        data: Dict[str, Any],
+        text_field: str,
     ) -> ChatPromptTemplate:
-        """Generate a prompt for analyzing Management Discussion and Analysis from specified form."""
-        form_type = mda_data.get("metadata", {}).get("form", "Unknown")
-
-        system_message = MDA_ANALYSIS_SYSTEM_PROMPT.format(form_type=form_type)
-
-        filing_info = mda_data.get("metadata", {})
-        filing_date = filing_info.get("filing_date", "Unknown")
-        period = filing_info.get("period_of_report", "Unknown")
+        """Shared prompt builder for MD&A and Risk Factors (10-K or 10-Q).
 
-        user_template = MDA_ANALYSIS_USER_TEMPLATE
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", system_message),
-                ("user", user_template),
-            ]
+        Both take {"text": "...", "metadata": {...}}; only the template
+        variable holding the section text differs.
+        """
+        filing_info = data.get("metadata", {})
+        return _section_template(system_prompt, user_template).partial(
+            ticker=ticker,
+            form_type=filing_info.get("form", "Unknown"),
+            filing_date=filing_info.get("filing_date", "Unknown"),
+            period=filing_info.get("period_of_report", "Unknown"),
+            format_instructions=_format_instructions(parser.pydantic_object),
+            **{text_field: _truncate_section_text(data.get("text", ""))},
         )
 
-        return prompt.partial(
-            ticker=ticker,
-            form_type=form_type,
-            filing_date=filing_date,
-            period=period,
-            mda_text=mda_data.get("text", ""),
-            format_instructions=self.mda_parser.get_format_instructions(),
+    def generate_mda_prompt(
+        self, ticker: str, mda_data: Dict[str, Any]
+    ) -> ChatPromptTemplate:
+        """Generate a prompt for analyzing Management Discussion and Analysis from specified form."""
+        return self._form_section_prompt(
+            MDA_ANALYSIS_SYSTEM_PROMPT, MDA_ANALYSIS_USER_TEMPLATE,
+            self.mda_parser, ticker, mda_data, "mda_text",
         )
 
     def generate_risk_factors_prompt(
         self, ticker: str, risk_data: Dict[str, Any]
     ) -> ChatPromptTemplate:
         """Generate a prompt for analyzing Risk Factors from specified form."""
-        form_type = risk_data.get("metadata", {}).get("form", "Unknown")
-
-        system_message = RISK_FACTORS_SYSTEM_PROMPT.format(form_type=form_type)
-
-        filing_info = risk_data.get("metadata", {})
-        filing_date = filing_info.get("filing_date", "Unknown")
-        period = filing_info.get("period_of_report", "Unknown")
-
-        user_template = RISK_FACTORS_USER_TEMPLATE
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", system_message),
-                ("user", user_template),
-            ]
-        )
-
-        return prompt.partial(
-            ticker=ticker,
-            form_type=form_type,
-            filing_date=filing_date,
-            period=period,
-            risk_text=risk_data.get("text", ""),
-            format_instructions=self.risk_parser.get_format_instructions(),
+        return self._form_section_prompt(
+            RISK_FACTORS_SYSTEM_PROMPT, RISK_FACTORS_USER_TEMPLATE,
+            self.risk_parser, ticker, risk_data, "risk_text",
         )
 
     def generate_balance_sheet_prompt(
@@ -316,22 +370,12 @@ class SECDocumentProcessor:
         tenq: dict,
     ) -> ChatPromptTemplate:
         """Generate a prompt for analyzing Balance Sheet from 10-K and 10-Q."""
-
-        system_message = BALANCE_SHEET_SYSTEM_PROMPT
-        user_template = BALANCE_SHEET_USER_TEMPLATE
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", system_message),
-                ("user", user_template),
-            ]
-        )
-
+        prompt = _section_template(BALANCE_SHEET_SYSTEM_PROMPT, BALANCE_SHEET_USER_TEMPLATE)
         return prompt.partial(
             ticker=ticker,
             tenk=tenk,
             tenq=tenq,
-            format_instructions=self.balance_sheet_parser.get_format_instructions(),
+            format_instructions=_format_instructions(self.balance_sheet_parser.pydantic_object),
         )
 
     def analyze_balance_sheet(
@@ -343,9 +387,9 @@ class SECDocumentProcessor:
             chain = prompt | self.llm | self.balance_sheet_parser
             return chain.invoke({})
         except Exception as e:
-            print(f"Error processing balance sheet: {e}")
+            logger.warning("Error processing balance sheet for %s: %s", ticker, e)
             # Return fallback values
-            return BalanceSheetAnalysis(
+            return BalanceSheetAnalysis.model_construct(
                 ticker=ticker,
                 summary="Error analyzing balance sheet section.",
                 key_metrics=["Unable to extract key metrics."],
@@ -365,9 +409,9 @@ class SECDocumentProcessor:
             chain = prompt | self.llm | self.mda_parser
             return chain.invoke({})
         except Exception as e:
-            print(f"Error processing MD&A: {e}")
+            logger.warning("Error processing MD&A for %s: %s", ticker, e)
             # Return fallback values
-            return MDnAAnalysis(
+            return MDnAAnalysis.model_construct(
                 summary="Error analyzing MD&A section.",
                 key_points=["Unable to extract key points."],
                 financial_highlights=["Unable to extract financial highlights."],
@@ -389,9 +433,9 @@ class SECDocumentProcessor:
             chain = prompt | self.llm | self.risk_parser
             return chain.invoke({})
         except Exception as e:
-            print(f"Error processing Risk Factors: {e}")
+            logger.warning("Error processing Risk Factors for %s: %s", ticker, e)
             # Return fallback values
-            return RiskFactorAnalysis(
+            return RiskFactorAnalysis.model_construct(
                 summary="Error analyzing Risk Factors section.",
                 key_risks=["Unable to extract key risks."],
                 risk_categories={"Processing Error": ["Unable to categorize risks."]},
@@ -415,10 +459,7 @@ class SECDocumentProcessor:
         """
         filing_info = earnings_data.get("metadata", {})
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", EARNINGS_ANALYSIS_SYSTEM_PROMPT),
-            ("user", EARNINGS_ANALYSIS_USER_TEMPLATE),
-        ])
+        prompt = _section_template(EARNINGS_ANALYSIS_SYSTEM_PROMPT, EARNINGS_ANALYSIS_USER_TEMPLATE)
 
         return prompt.partial(
             ticker=ticker,
@@ -429,7 +470,7 @@ class SECDocumentProcessor:
             income_statement=str(earnings_data.get("income_statement", "Not available")),
             balance_sheet=str(earnings_data.get("balance_sheet", "Not available")),
             cash_flow=str(earnings_data.get("cash_flow", "Not available")),
-            format_instructions=self.earnings_parser.get_format_instructions(),
+            format_instructions=_format_instructions(self.earnings_parser.pydantic_object),
         )
 
     def generate_material_event_prompt(
@@ -442,10 +483,7 @@ class SECDocumentProcessor:
         """
         filing_info = event_data.get("metadata", {})
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", MATERIAL_EVENT_SYSTEM_PROMPT),
-            ("user", MATERIAL_EVENT_USER_TEMPLATE),
-        ])
+        prompt = _section_template(MATERIAL_EVENT_SYSTEM_PROMPT, MATERIAL_EVENT_USER_TEMPLATE)
 
         return prompt.partial(
             ticker=ticker,
@@ -455,7 +493,7 @@ class SECDocumentProcessor:
             items=str(event_data.get("items", [])),
             event_context=event_data.get("context", ""),
             event_text=event_data.get("text", ""),
-            format_instructions=self.material_event_parser.get_format_instructions(),
+            format_instructions=_format_instructions(self.material_event_parser.pydantic_object),
         )
 
     def analyze_earnings(
@@ -467,8 +505,8 @@ class SECDocumentProcessor:
             chain = prompt | self.llm | self.earnings_parser
             return chain.invoke({})
         except Exception as e:
-            print(f"Error processing earnings: {e}")
-            return EarningsAnalysis(
+            logger.warning("Error processing earnings for %s: %s", ticker, e)
+            return EarningsAnalysis.model_construct(
                 summary="Error analyzing earnings release.",
                 key_metrics=["Unable to extract key metrics."],
                 beats_misses=["Unable to determine beats or misses."],
@@ -487,8 +525,8 @@ class SECDocumentProcessor:
             chain = prompt | self.llm | self.material_event_parser
             return chain.invoke({})
         except Exception as e:
-            print(f"Error processing material event: {e}")
-            return MaterialEventAnalysis(
+            logger.warning("Error processing material event for %s: %s", ticker, e)
+            return MaterialEventAnalysis.model_construct(
                 summary="Error analyzing material event.",
                 event_type=event_data.get("content_type", "unknown"),
                 key_points=["Unable to extract key points."],
@@ -513,16 +551,13 @@ class SECDocumentProcessor:
         All four sections have the same input shape: {"text": "...", "metadata": {...}}.
         """
         filing_info = data.get("metadata", {})
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("user", user_template),
-        ])
+        prompt = _section_template(system_prompt, user_template)
         return prompt.partial(
             ticker=ticker,
             filing_date=filing_info.get("filing_date", "Unknown"),
             period=filing_info.get("period_of_report", "Unknown"),
-            content_text=data.get("text", ""),
-            format_instructions=parser.get_format_instructions(),
+            content_text=_truncate_section_text(data.get("text", "")),
+            format_instructions=_format_instructions(parser.pydantic_object),
         )
 
     def analyze_business_overview(
@@ -536,8 +571,8 @@ class SECDocumentProcessor:
         try:
             return (prompt | self.llm | self.business_overview_parser).invoke({})
         except Exception as e:
-            print(f"Error processing Business Overview: {e}")
-            return BusinessOverviewAnalysis(
+            logger.warning("Error processing Business Overview for %s: %s", ticker, e)
+            return BusinessOverviewAnalysis.model_construct(
                 summary="Error analyzing Business Overview section.",
                 business_segments=["Unable to extract segments."],
                 key_products_services=["Unable to extract products/services."],
@@ -558,8 +593,8 @@ class SECDocumentProcessor:
         try:
             return (prompt | self.llm | self.cybersecurity_parser).invoke({})
         except Exception as e:
-            print(f"Error processing Cybersecurity: {e}")
-            return CybersecurityAnalysis(
+            logger.warning("Error processing Cybersecurity for %s: %s", ticker, e)
+            return CybersecurityAnalysis.model_construct(
                 summary="Error analyzing Cybersecurity section.",
                 governance_overview="Analysis unavailable due to processing error.",
                 key_disclosures=["Unable to extract disclosures."],
@@ -580,8 +615,8 @@ class SECDocumentProcessor:
         try:
             return (prompt | self.llm | self.legal_proceedings_parser).invoke({})
         except Exception as e:
-            print(f"Error processing Legal Proceedings: {e}")
-            return LegalProceedingsAnalysis(
+            logger.warning("Error processing Legal Proceedings for %s: %s", ticker, e)
+            return LegalProceedingsAnalysis.model_construct(
                 summary="Error analyzing Legal Proceedings section.",
                 key_cases=["Unable to extract cases."],
                 red_flags=[],
@@ -602,8 +637,8 @@ class SECDocumentProcessor:
         try:
             return (prompt | self.llm | self.market_risk_parser).invoke({})
         except Exception as e:
-            print(f"Error processing Market Risk: {e}")
-            return MarketRiskAnalysis(
+            logger.warning("Error processing Market Risk for %s: %s", ticker, e)
+            return MarketRiskAnalysis.model_construct(
                 summary="Error analyzing Market Risk section.",
                 key_exposures=["Unable to extract exposures."],
                 risk_assessment="Analysis unavailable due to processing error.",
@@ -627,17 +662,14 @@ class SECDocumentProcessor:
                          "tenq": <json dict or None>, "tenq_metadata": {...}}
         """
         tenk_meta = raw_data.get("tenk_metadata") or {}
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("user", user_template),
-        ])
+        prompt = _section_template(system_prompt, user_template)
         return prompt.partial(
             ticker=ticker,
             filing_date=tenk_meta.get("filing_date", "Unknown"),
             period=tenk_meta.get("period_of_report", "Unknown"),
             tenk_data=str(raw_data.get("tenk") or "Not available"),
             tenq_data=str(raw_data.get("tenq") or "Not available"),
-            format_instructions=parser.get_format_instructions(),
+            format_instructions=_format_instructions(parser.pydantic_object),
         )
 
     def analyze_income_statement(
@@ -651,8 +683,8 @@ class SECDocumentProcessor:
         try:
             return (prompt | self.llm | self.income_statement_parser).invoke({})
         except Exception as e:
-            print(f"Error processing Income Statement: {e}")
-            return IncomeStatementAnalysis(
+            logger.warning("Error processing Income Statement for %s: %s", ticker, e)
+            return IncomeStatementAnalysis.model_construct(
                 summary="Error analyzing income statement.",
                 key_metrics=["Unable to extract key metrics."],
                 revenue_analysis="Analysis unavailable due to processing error.",
@@ -674,8 +706,8 @@ class SECDocumentProcessor:
         try:
             return (prompt | self.llm | self.cash_flow_parser).invoke({})
         except Exception as e:
-            print(f"Error processing Cash Flow: {e}")
-            return CashFlowAnalysis(
+            logger.warning("Error processing Cash Flow for %s: %s", ticker, e)
+            return CashFlowAnalysis.model_construct(
                 summary="Error analyzing cash flow statement.",
                 key_metrics=["Unable to extract key metrics."],
                 operating_cash_flow_analysis="Analysis unavailable due to processing error.",
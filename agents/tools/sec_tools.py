@@ -1,5 +1,6 @@
-import json
+import logging
 from concurrent.futures import ThreadPoolExecutor
+import orjson
 from cachetools import LRUCache, TTLCache
 from langchain_core.tools import Tool
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -8,6 +9,8 @@ from typing import Dict, Any, Optional
 from agents.sec_workflow.get_SEC_data import SECDataRetrieval
 from agents.sec_workflow.sec_llm_models import SECDocumentProcessor
 
+logger = logging.getLogger(__name__)
+
 
 def _dump_analysis_json(result: Any) -> str:
     """Serialize a cached analysis dict (or error) to JSON for the synthesizer.
@@ -20,11 +23,17 @@ def _dump_analysis_json(result: Any) -> str:
     ``filing_metadata`` rather than parsing prose.
 
     ``default=str`` handles non-serializable types (numpy scalars, datetimes)
-    that may slip through ``model_dump()``.
+    that may slip through ``model_dump()``. orjson rather than stdlib json:
+    every SEC tool result passes through here on each chat turn, and the
+    synthesizer re-parses it straight away.
     """
-    if isinstance(result, dict):
-        return json.dumps(result, indent=2, default=str)
-    return json.dumps({"value": str(result)}, indent=2)
+    if not isinstance(result, dict):
+        result = {"value": str(result)}
+    return orjson.dumps(
+        result,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode()
 
 
 # Bounded caches: LRU for retriever/processor objects (size-bound only),
@@ -44,7 +53,7 @@ def _get_shared_retriever(ticker: str) -> SECDataRetrieval:
     a 10-K should call ``_require_10k()`` before accessing 10-K data.
     """
     if ticker not in _shared_retrievers:
-        print(f"Making single SEC API call for {ticker}...")
+        logger.debug("Creating shared SEC retriever for %s", ticker)
         retriever = SECDataRetrieval(ticker)
         _shared_retrievers[ticker] = retriever
         _processed_cache[ticker] = {}
@@ -272,11 +281,14 @@ def _tool_all_summaries(ticker: str, llm: BaseChatModel) -> str:
         mda_summary = mda_future.result()
         balance_summary = balance_future.result()
 
-    summary = f"Comprehensive Analysis for {ticker}:\n\n"
-    summary += f"=== RISK ANALYSIS ===\n{risk_summary}\n\n"
-    summary += f"=== MANAGEMENT OUTLOOK ===\n{mda_summary}\n\n"
-    summary += f"=== FINANCIAL HEALTH ===\n{balance_summary}\n"
-    return summary
+    # Each section is a full analysis JSON dump; build the report in one join
+    # rather than re-copying the growing string on every +=.
+    return "".join((
+        f"Comprehensive Analysis for {ticker}:\n\n",
+        f"=== RISK ANALYSIS ===\n{risk_summary}\n\n",
+        f"=== MANAGEMENT OUTLOOK ===\n{mda_summary}\n\n",
+        f"=== FINANCIAL HEALTH ===\n{balance_summary}\n",
+    ))
 
 
 # ── 8-K tool functions ────────────────────────────────────────────────────────
@@ -389,14 +401,12 @@ def _tool_analyze_latest_8k(ticker: str, llm: BaseChatModel) -> str:
         retriever = _get_shared_retriever(ticker)
         overview = retriever.get_8k_overview()
         if not overview.get("found"):
-            return json.dumps(
-                {"found": False, "reason": f"No 8-K filing found for {ticker}"},
-                indent=2,
+            return _dump_analysis_json(
+                {"found": False, "reason": f"No 8-K filing found for {ticker}"}
             )
     except Exception as e:
-        return json.dumps(
-            {"error": str(e), "tool": "analyze_latest_8k", "ticker": ticker},
-            indent=2,
+        return _dump_analysis_json(
+            {"error": str(e), "tool": "analyze_latest_8k", "ticker": ticker}
         )
 
     if overview.get("has_earnings"):
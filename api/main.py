@@ -33,7 +33,7 @@ load_dotenv(Path(__file__).parent.parent / ".env")
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from edgar import set_identity
+from edgar import set_identity, use_local_storage
 
 from api.clerk_auth import is_auth_disabled, is_clerk_enabled
 from api.db import init_db, close_db
@@ -112,11 +112,31 @@ def set_sec_identity() -> None:
     logger.info("SEC EDGAR identity set: %s", header)
 
 
+def configure_sec_storage() -> None:
+    """Opt in to edgartools' on-disk EDGAR store when SEC_LOCAL_DATA_DIR is set.
+
+    With local storage on, edgartools keeps company submissions and any
+    bulk-downloaded filings under that directory and reads them from disk
+    instead of re-fetching over HTTPS on every cold start. Network fallback
+    stays enabled so anything not yet on disk is still fetched. Off by
+    default: submissions cached on disk are not refreshed by edgartools, so
+    a long-lived store can lag behind newly filed 10-Qs/8-Ks.
+    """
+    path = (os.getenv("SEC_LOCAL_DATA_DIR") or "").strip()
+    if not path:
+        return
+    storage_dir = Path(path).expanduser()
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    use_local_storage(storage_dir, allow_network_fallback=True)
+    logger.info("SEC EDGAR local storage enabled: %s", storage_dir)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     check_production_auth_config()
     check_production_sec_config()
     set_sec_identity()
+    configure_sec_storage()
     await init_db()
     yield
     await close_db()
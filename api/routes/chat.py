@@ -5,6 +5,7 @@ import json
 import logging
 import os
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from langchain_core.messages import HumanMessage, AIMessage
 
@@ -44,12 +45,15 @@ MAX_QUERY_LENGTH = 4000
 async def _safe_send(websocket: WebSocket, data: dict) -> bool:
     """Send JSON with a send timeout; return False if the peer is gone or slow.
 
-    A hanging `send_json` would otherwise pin the agent task on a slow consumer
+    A hanging send would otherwise pin the agent task on a slow consumer
     (full TCP buffer, dead connection that hasn't been reaped yet).
+
+    Encoded with orjson rather than `send_json`'s stdlib json — this is the
+    per-token hot path, tens of events per second per streaming session.
     """
     try:
         await asyncio.wait_for(
-            websocket.send_json(data),
+            websocket.send_text(orjson.dumps(data).decode()),
             timeout=WS_SEND_TIMEOUT_SECONDS,
         )
         return True
@@ -15,6 +15,7 @@ import logging
 import time
 from typing import Any
 
+import orjson
 from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -176,9 +177,27 @@ async def _build_profile(ticker: str) -> dict[str, Any]:
         "patterns": patterns,
         "regime": regime,
     }
-    # Round-trip through JSON off the event loop to coerce numpy floats,
-    # Timestamps, etc. to JSON-safe primitives.
-    return await asyncio.to_thread(lambda: json.loads(json.dumps(raw, default=str)))
+    return await asyncio.to_thread(_json_safe, raw)
+
+
+def _json_safe(raw: dict[str, Any]) -> dict[str, Any]:
+    """Round-trip through JSON to coerce numpy floats, Timestamps, etc. to
+    JSON-safe primitives.
+
+    orjson keeps numpy ints as numbers (stdlib json stringified them via
+    default=str) and writes NaN as null. yfinance ``info`` values are
+    unvalidated, and orjson rejects what stdlib json accepts (ints above
+    64 bits), so those profiles fall back to the stdlib round-trip.
+    """
+    try:
+        return orjson.loads(orjson.dumps(
+            raw,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ))
+    except orjson.JSONEncodeError as e:
+        logger.debug("orjson could not serialize profile, using stdlib json: %s", e)
+        return json.loads(json.dumps(raw, default=str))
 
 
 @router.get("/{ticker}/profile")
@@ -229,8 +248,17 @@ async def get_company_profile(ticker: str, keys: ApiKeys = Depends(get_api_keys)
 # =============================================================================
 
 def _sse(data: dict) -> str:
-    """Format a dict as a single SSE data line."""
-    return f"data: {json.dumps(data)}\n\n"
+    """Format a dict as a single SSE data line.
+
+    orjson: section payloads are full filing analyses, and orjson also writes
+    NaN as null (stdlib json emits bare NaN, which JSON.parse rejects).
+    """
+    payload = orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+    return f"data: {payload.decode()}\n\n"
 
 
 def _build_edgar_url(cik: str, accession: str) -> str:
@@ -264,6 +292,13 @@ def _fetch_filing_data(ticker: str, fetch_raw: bool = True) -> dict[str, Any]:
     from agents.sec_workflow.get_SEC_data import SECDataRetrieval
 
     retriever = SECDataRetrieval(ticker)
+    # Fetch the three filings side by side; the sequential section below then
+    # reads from the retriever's warm caches. The 8-K is always parsed — its
+    # overview picks the cache key even for keyless callers.
+    retriever.prefetch(
+        ("10-K", "10-Q", "8-K"),
+        metadata_only=() if fetch_raw else ("10-K", "10-Q"),
+    )
     result: dict[str, Any] = {"ticker": ticker}
 
     # --- 10-K (or 20-F for foreign filers) ---
@@ -475,7 +510,7 @@ async def _analyze_or_cache(
     if cached:
         logger.info("[%s] CACHE HIT  %s/%s", ticker, form_type, analysis_type)
         progress("cached")
-        return "cached", json.loads(cached["analysis_json"])
+        return "cached", orjson.loads(cached["analysis_json"])
 
     if not api_key:
         # Cache miss with no key to generate — anonymous / keyless caller.
@@ -491,7 +526,7 @@ async def _analyze_or_cache(
                 _run_llm_analysis, ticker, analysis_type, llm_input, model_id, api_key,
             )
         await save_filing_analysis(
-            ticker, form_type, accession, analysis_type, json.dumps(analysis),
+            ticker, form_type, accession, analysis_type, orjson.dumps(analysis).decode(),
         )
         duration = round(time.monotonic() - t0, 1)
         logger.info("[%s] LLM DONE   %s/%s (%.1fs)", ticker, form_type, analysis_type, duration)
@@ -83,6 +83,32 @@ def _reset_rate_limit_state():
     _timestamps.clear()
 
 
+@pytest.fixture(autouse=True)
+def _reset_llm_cache():
+    """Drop cached LLM responses and shared model instances between tests so a
+    stubbed model in one test can't answer for a real (or differently stubbed)
+    model in the next."""
+    from agents.llm_cache import clear_llm_cache
+    from agents.llm_factory import clear_llm_instance_cache
+
+    clear_llm_cache()
+    clear_llm_instance_cache()
+    yield
+    clear_llm_cache()
+    clear_llm_instance_cache()
+
+
+@pytest.fixture(autouse=True)
+def _disable_sec_disk_cache(monkeypatch):
+    """Keep the on-disk SEC extraction cache off even if SEC_CACHE_DIR is set
+    in .env, so tests never read or write the developer's real cache. Tests
+    of the cache itself point it at tmp_path."""
+    from agents.sec_workflow import get_SEC_data
+
+    monkeypatch.setattr(get_SEC_data, "SEC_CACHE_DIR", "")
+    yield
+
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
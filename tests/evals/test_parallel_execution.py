@@ -19,6 +19,7 @@ import pytest
 from langchain_core.tools import Tool
 from langgraph.types import Send
 
+from agents.graph import analyst_graph
 from agents.graph.analyst_graph import (
     create_worker_node,
     dispatch_steps,
@@ -118,6 +119,17 @@ class TestDispatchSteps:
         assert len(sends) == 3
         assert all(s.node == "worker" for s in sends)
 
+    def test_duplicate_tools_share_one_send(self):
+        """Steps calling the same tool collapse into one Send listing every id."""
+        plan = _make_plan(
+            [_make_step(1, "tool_a"), _make_step(2, "tool_b"), _make_step(3, "tool_a")]
+        )
+        sends = dispatch_steps({"plan": plan})
+
+        assert len(sends) == 2
+        assert [s.arg["step"].id for s in sends] == [1, 2]
+        assert [s.arg["step_ids"] for s in sends] == [[1, 3], [2]]
+
     def test_empty_plan_routes_to_synthesizer(self):
         empty_plan = QueryPlan(
             query_type="simple",
@@ -160,6 +172,20 @@ class TestWorkerNode:
         assert result["filing_ref"] is None
         assert result["error"] is None
 
+    async def test_fans_result_to_every_step_id(self):
+        calls = []
+
+        def tool(q=""):
+            calls.append(q)
+            return "result_a"
+
+        worker = create_worker_node({"tool_a": _as_tool("tool_a", tool)})
+        delta = await worker({"step": _make_step(1, "tool_a"), "step_ids": [1, 3]})
+
+        assert len(calls) == 1
+        assert set(delta["step_results"]) == {1, 3}
+        assert delta["step_results"][3]["raw"] == "result_a"
+
     async def test_parses_json_tool_output(self):
         payload = (
             '{"filing_metadata": {"accession_number": "0000320193-25-000001",'
@@ -177,6 +203,17 @@ class TestWorkerNode:
         assert result["raw"] == payload
         assert result["error"] is None
 
+    async def test_large_output_parsed_off_loop(self, monkeypatch):
+        """Results above the offload threshold parse identically in a thread."""
+        monkeypatch.setattr(analyst_graph, "STEP_RESULT_OFFLOAD_CHARS", 1)
+        payload = '{"event_type": "earnings_release"}'
+        tools_dict = {"json_tool": _as_tool("json_tool", lambda q="": payload)}
+        worker = create_worker_node(tools_dict)
+
+        result = (await worker({"step": _make_step(1, "json_tool")}))["step_results"][1]
+        assert result["data"] == {"event_type": "earnings_release"}
+        assert result["raw"] == payload
+
     async def test_handles_non_json_tool_output(self):
         """Prose-returning tools land in raw with empty data."""
         tools_dict = {"tool_a": _as_tool("tool_a", lambda q="": "AAPL is at $185")}
@@ -264,6 +301,23 @@ class TestSendFanOutEndToEnd:
         assert final["step_results"][1]["raw"] == "ra"
         assert final["step_results"][2]["raw"] == "rb"
 
+    async def test_duplicate_tool_runs_once(self):
+        """Two steps on the same tool produce one call and two step_results."""
+        calls = []
+
+        def tool_a(q=""):
+            calls.append(q)
+            return "ra"
+
+        tools_dict = {"tool_a": _as_tool("tool_a", tool_a)}
+        plan = _make_plan([_make_step(1, "tool_a"), _make_step(2, "tool_a")])
+        compiled = self._compile_minimal_graph(tools_dict)
+
+        final = await compiled.ainvoke(_make_state(plan))
+
+        assert len(calls) == 1
+        assert final["step_results"][1]["raw"] == final["step_results"][2]["raw"] == "ra"
+
 
 # ===========================================================================
 # StepResult plumbing: reducer and filing_ref extractor
@@ -287,6 +341,11 @@ class TestMergeStepResults:
     def test_empty_inputs(self):
         assert merge_step_results({}, {}) == {}
 
+    def test_empty_side_returns_other_without_copy(self):
+        delta = {1: {"tool": "a", "data": {}, "raw": "ra", "filing_ref": None, "error": None}}
+        assert merge_step_results({}, delta) is delta
+        assert merge_step_results(delta, {}) is delta
+
     def test_right_wins_on_collision(self):
         """If a key appears on both sides (shouldn't in practice), right wins.
 
@@ -4,11 +4,21 @@ Marker: eval_unit — NO API keys needed. These test the deterministic routing
 logic by constructing state dicts directly and calling the routing function.
 
 `route_by_complexity` decides: simple → react_agent, anything else → planner.
+The router/planner node tests stub the planner to check that one combined
+classify_and_plan call feeds both nodes, and that single-metric lookups skip
+it entirely.
 """
 
 import pytest
+from langchain_core.messages import HumanMessage
 
-from agents.graph.analyst_graph import route_by_complexity, UNCLEAR_QUERY_RESPONSE
+from agents.graph.analyst_graph import (
+    create_planner_node,
+    create_router_node,
+    route_by_complexity,
+    UNCLEAR_QUERY_RESPONSE,
+)
+from agents.planner import AnalysisStep, QueryClassification, QueryPlan, is_simple_lookup
 
 
 # ---------------------------------------------------------------------------
@@ -73,3 +83,127 @@ class TestRouteByComplexity:
         """Empty string is not 'simple', so default route is planner."""
         state = _make_state("")
         assert route_by_complexity(state) == "planner"
+
+
+# ---------------------------------------------------------------------------
+# Router + planner nodes share one classify_and_plan call
+# ---------------------------------------------------------------------------
+
+
+class _StubPlanner:
+    """Records which planner methods the nodes call."""
+
+    def __init__(self, complexity: str, estimated_tools: int, plan=None):
+        self.calls = []
+        self._classification = QueryClassification(
+            complexity=complexity, reasoning="stub", estimated_tools=estimated_tools
+        )
+        self._plan = plan
+
+    def classify_and_plan(self, query):
+        self.calls.append("classify_and_plan")
+        return self._classification, self._plan
+
+    def create_plan(self, query):
+        self.calls.append("create_plan")
+        return _one_step_plan("fallback")
+
+
+def _one_step_plan(action: str = "Get info") -> QueryPlan:
+    return QueryPlan(
+        query_type="complex",
+        requires_planning=True,
+        steps=[AnalysisStep(id=1, action=action, tool="get_stock_info", rationale="r")],
+    )
+
+
+class TestRouterPlannerHandoff:
+    @pytest.mark.eval_unit
+    async def test_complex_plan_reused_by_planner_node(self):
+        planner = _StubPlanner("complex", 4, plan=_one_step_plan())
+        state = _make_state("", messages=[HumanMessage(content="full due diligence")])
+
+        state = await create_router_node(planner)(state)
+        state = await create_planner_node(planner)(state)
+
+        assert route_by_complexity(state) == "planner"
+        assert state["plan"].steps[0].action == "Get info"
+        assert planner.calls == ["classify_and_plan"]
+
+    @pytest.mark.eval_unit
+    async def test_planner_node_falls_back_when_plan_missing(self):
+        planner = _StubPlanner("moderate", 2, plan=None)
+        state = _make_state("", messages=[HumanMessage(content="main risks?")])
+
+        state = await create_router_node(planner)(state)
+        state = await create_planner_node(planner)(state)
+
+        assert state["plan"].steps[0].action == "fallback"
+        assert planner.calls == ["classify_and_plan", "create_plan"]
+
+    @pytest.mark.eval_unit
+    async def test_simple_query_does_not_stash_plan(self):
+        planner = _StubPlanner("simple", 1, plan=_one_step_plan())
+        state = _make_state("", messages=[HumanMessage(content="price?")])
+
+        state = await create_router_node(planner)(state)
+
+        assert route_by_complexity(state) == "react_agent"
+        assert state["plan"] is None
+
+    @pytest.mark.eval_unit
+    async def test_single_metric_lookup_skips_classifier(self):
+        planner = _StubPlanner("complex", 4, plan=_one_step_plan())
+        state = _make_state("", messages=[HumanMessage(content="What is AAPL's P/E ratio?")])
+
+        state = await create_router_node(planner)(state)
+
+        assert route_by_complexity(state) == "react_agent"
+        assert state["classification"].complexity == "simple"
+        assert planner.calls == []
+
+    @pytest.mark.eval_unit
+    async def test_planner_node_drops_unknown_tools(self):
+        plan = QueryPlan(
+            query_type="complex",
+            requires_planning=True,
+            steps=[
+                AnalysisStep(id=1, action="ok", tool="get_stock_info", rationale="r"),
+                AnalysisStep(id=2, action="bad", tool="made_up_tool", rationale="r"),
+            ],
+        )
+        planner = _StubPlanner("complex", 2, plan=plan)
+        state = _make_state("complex", messages=[HumanMessage(content="q")], plan=plan)
+
+        state = await create_planner_node(planner, frozenset({"get_stock_info"}))(state)
+
+        assert [s.tool for s in state["plan"].steps] == ["get_stock_info"]
+        assert planner.calls == []
+
+
+# ---------------------------------------------------------------------------
+# is_simple_lookup pre-filter
+# ---------------------------------------------------------------------------
+
+
+class TestSimpleLookupPrefilter:
+    @pytest.mark.eval_unit
+    def test_matches_only_simple_router_cases(self, router_cases):
+        """The pre-filter may miss simple queries but must never claim a
+        complex or unclear one — those need the LLM classifier."""
+        for case in router_cases:
+            if case["expected_complexity"] != "simple":
+                assert not is_simple_lookup(case["query"]), case["id"]
+
+    @pytest.mark.eval_unit
+    @pytest.mark.parametrize(
+        "query",
+        ["What's the price and P/E?", "Compare AAPL's market cap vs MSFT", "hi",
+         "How has the price trended this year?"],
+    )
+    def test_multi_intent_or_non_metric_falls_through(self, query):
+        assert not is_simple_lookup(query)
+
+    @pytest.mark.eval_unit
+    def test_single_metric_matches(self):
+        assert is_simple_lookup("What is Apple's market cap?")
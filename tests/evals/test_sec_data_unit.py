@@ -17,6 +17,16 @@ from agents.sec_workflow.get_SEC_data import SECDataRetrieval, _TENK_ITEM_KEYS,
 from edgar import CompanyNotFoundError
 
 
+@pytest.fixture(autouse=True)
+def _fresh_filing_caches():
+    """Filing lookups are cached process-wide; keep tests independent."""
+    from agents.sec_workflow.get_SEC_data import clear_filing_caches
+
+    clear_filing_caches()
+    yield
+    clear_filing_caches()
+
+
 # ── _is_substantive ──────────────────────────────────────────────────────────
 
 @pytest.mark.eval_unit
@@ -141,6 +151,7 @@ class TestGetSection:
         meta = FilingMetadata("10-K", "123", "acc-001", "2025-01-01", "2024-12-31", "Test Corp")
         retriever._tenk_metadata = meta
         retriever._tenq_metadata = FilingMetadata("10-Q", "123", "acc-002", "2025-03-01", "2025-03-31", "Test Corp")
+        retriever._section_cache = {}
 
         # Delegate get_section to the real implementation
         retriever.get_section = lambda form, item: SECDataRetrieval.get_section(retriever, form, item)
@@ -177,6 +188,22 @@ class TestGetSection:
         result = r.get_section("10-Q", "1A")
         assert not result["found"]
 
+    def test_found_section_extracted_once(self):
+        r = self._make_retriever()
+        first = r.get_section("10-K", "7")
+        first["metadata"]["accession"] = "mutated"
+        second = r.get_section("10-K", "7")
+
+        assert r.get_tenk.return_value.__getitem__.call_count == 1
+        assert second["text"] == "text"
+        assert second["metadata"]["accession"] == "acc-001"
+
+    def test_missing_section_not_memoized(self):
+        r = self._make_retriever(tenq_text=None)
+        r.get_section("10-Q", "1A")
+        r.get_section("10-Q", "1A")
+        assert r.get_tenq.return_value.__getitem__.call_count == 2
+
 
 # ── New retrieval methods route to correct item codes ────────────────────────
 
@@ -383,3 +410,352 @@ class TestGetEightkFiling:
         r.get_eightk_filing = lambda: SECDataRetrieval.get_eightk_filing(r)
         with pytest.raises(ValueError, match="No 8-K available"):
             r.get_eightk_filing()
+
+
+@pytest.mark.eval_unit
+class TestPrefetch:
+    """prefetch() warms several forms concurrently and swallows failures."""
+
+    def _make_retriever(self, delay: float = 0.2):
+        import time
+
+        r = MagicMock(spec=SECDataRetrieval)
+        r._PREFETCH_GETTERS = SECDataRetrieval._PREFETCH_GETTERS
+        r.calls = []
+
+        def _getter(name, fail=False):
+            def _get():
+                time.sleep(delay)
+                r.calls.append(name)
+                if fail:
+                    raise ValueError(f"no {name}")
+            return _get
+
+        r.get_tenk = _getter("get_tenk")
+        r.get_tenq = _getter("get_tenq")
+        r.get_eightk = _getter("get_eightk", fail=True)
+        r.get_tenk_filing = _getter("get_tenk_filing")
+        return r
+
+    def test_forms_fetched_in_parallel(self):
+        import time
+
+        r = self._make_retriever()
+        start = time.monotonic()
+        SECDataRetrieval.prefetch(r, ("10-K", "10-Q", "8-K"))
+        elapsed = time.monotonic() - start
+
+        assert sorted(r.calls) == ["get_eightk", "get_tenk", "get_tenq"]
+        assert elapsed < 0.5, f"Took {elapsed:.2f}s — fetches likely ran sequentially"
+
+    def test_metadata_only_stops_at_lookup(self):
+        r = self._make_retriever(delay=0)
+        SECDataRetrieval.prefetch(r, ("10-K",), metadata_only=("10-K",))
+        assert r.calls == ["get_tenk_filing"]
+
+
+@pytest.mark.eval_unit
+class TestCheckFilingAvailability:
+    """Availability lookups run concurrently and warm the filing caches."""
+
+    def _make_retriever(self, delay: float = 0.2, missing=("20-F",)):
+        import time
+
+        r = SECDataRetrieval.__new__(SECDataRetrieval)
+        r.ticker = "AAPL"
+        for form in ("tenk", "tenq", "eightk", "twentyf"):
+            setattr(r, f"_{form}_filing", None)
+            setattr(r, f"_{form}_metadata", None)
+
+        def _latest(form):
+            time.sleep(delay)
+            return None if form in missing else MagicMock(form=form)
+
+        r.company = MagicMock()
+        r.company.name = "Apple Inc."
+        r.company.is_foreign = False
+        r.company.latest.side_effect = lambda form: _latest(form)
+        r.company.get_filings.return_value.latest.side_effect = lambda n: _latest("8-K")
+        return r
+
+    def test_lookups_run_in_parallel(self):
+        import time
+
+        r = self._make_retriever()
+        start = time.monotonic()
+        result = r.check_filing_availability()
+        elapsed = time.monotonic() - start
+
+        assert (result["has_10k"], result["has_10q"], result["has_8k"]) == (True, True, True)
+        assert result["has_20f"] is False
+        assert elapsed < 0.6, f"Took {elapsed:.2f}s — lookups likely ran sequentially"
+
+    def test_found_filings_are_reused(self):
+        r = self._make_retriever(delay=0)
+        r.check_filing_availability()
+        r.get_tenk_filing()
+
+        forms = [c.kwargs["form"] for c in r.company.latest.call_args_list]
+        assert forms.count("10-K") == 1
+
+
+@pytest.mark.eval_unit
+class TestBalanceSheetAsStr:
+    """extract_balance_sheet_as_str emits compact split JSON, not padded text."""
+
+    def test_split_json_without_padding(self):
+        import json
+
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {"2024-09-28": [364980.0, 308030.0]},
+            index=["Total Assets", "Total Liabilities"],
+        )
+        r = SECDataRetrieval.__new__(SECDataRetrieval)
+        r.get_balance_sheet_df = MagicMock(return_value=df)
+
+        out = r.extract_balance_sheet_as_str("tenk")
+
+        assert "  " not in out["tenk"]
+        parsed = json.loads(out["tenk"])
+        assert parsed["columns"] == ["2024-09-28"]
+        assert parsed["index"] == ["Total Assets", "Total Liabilities"]
+
+
+@pytest.mark.eval_unit
+class TestFrameToSplitDict:
+    """_frame_to_split_dict matches the stdlib to_json → loads round-trip."""
+
+    def test_matches_stdlib_round_trip(self):
+        import json
+
+        import numpy as np
+        import pandas as pd
+
+        from agents.sec_workflow.get_SEC_data import _frame_to_split_dict
+
+        df = pd.DataFrame(
+            {"label": ["Cash", "Debt"], "2024": [1.5e9, np.nan], "abstract": [False, True]},
+            index=["r1", "r2"],
+        )
+        out = _frame_to_split_dict(df)
+
+        assert out == json.loads(df.to_json(orient="split"))
+        assert out["data"][1][1] is None
+
+
+@pytest.mark.eval_unit
+class TestBalanceSheetDfMemo:
+    """The balance sheet DataFrame is built from XBRL once per form."""
+
+    def _make_retriever(self):
+        import pandas as pd
+
+        r = SECDataRetrieval.__new__(SECDataRetrieval)
+        r._balance_sheet_dfs = {}
+        r._tenk_metadata = None
+        r.get_tenk = MagicMock()
+        stmt = r.get_tenk.return_value.financials.balance_sheet.return_value
+        stmt.to_dataframe.return_value = pd.DataFrame({"2024": [1.0]}, index=["Total Assets"])
+        return r
+
+    def test_str_and_json_extractors_share_one_build(self):
+        r = self._make_retriever()
+        r.extract_balance_sheet_as_str("10-K")
+        r.extract_balance_sheet_as_json("10-K")
+        r.get_balance_sheet_df("10-K")
+
+        assert r.get_tenk.return_value.financials.balance_sheet.call_count == 1
+
+
+@pytest.mark.eval_unit
+class TestBalanceSheetBothForms:
+    """The "both" path downloads the 10-K and 10-Q side by side."""
+
+    def _make_retriever(self, delay: float = 0.2):
+        import time
+
+        import pandas as pd
+
+        r = SECDataRetrieval.__new__(SECDataRetrieval)
+        r._balance_sheet_dfs = {}
+        r._tenk_metadata = None
+        r._tenq_metadata = None
+
+        def _slow_obj():
+            time.sleep(delay)
+            obj = MagicMock()
+            stmt = obj.financials.balance_sheet.return_value
+            stmt.to_dataframe.return_value = pd.DataFrame({"2024": [1.0]}, index=["Cash"])
+            return obj
+
+        objs = {}
+
+        def _getter(form):
+            def _get():
+                if form not in objs:
+                    objs[form] = _slow_obj()
+                return objs[form]
+            return _get
+
+        r.get_tenk = _getter("10-K")
+        r.get_tenq = _getter("10-Q")
+        return r
+
+    def test_both_forms_fetched_in_parallel(self):
+        import time
+
+        r = self._make_retriever()
+        start = time.monotonic()
+        out = r.extract_balance_sheet_as_json("both")
+        elapsed = time.monotonic() - start
+
+        assert out["tenk"]["index"] == ["Cash"]
+        assert out["tenq"]["index"] == ["Cash"]
+        assert elapsed < 0.35, f"Took {elapsed:.2f}s — filings likely fetched sequentially"
+
+
+@pytest.mark.eval_unit
+class TestFilingMetadata:
+    def _meta(self):
+        from agents.sec_workflow.get_SEC_data import FilingMetadata
+        return FilingMetadata("10-K", "123", "acc-001", "2025-01-01", "2024-12-31", "Test Corp")
+
+    def test_to_dict_returns_independent_copies(self):
+        meta = self._meta()
+        first = meta.to_dict()
+        first["edgar_url"] = "https://example.test"
+
+        assert "edgar_url" not in meta.to_dict()
+        assert meta.to_dict()["accession"] == "acc-001"
+
+    def test_slotted(self):
+        with pytest.raises(AttributeError):
+            self._meta().unexpected = 1
+
+
+@pytest.mark.eval_unit
+class TestSharedFilingCaches:
+    """Filing lookups and parsed documents are shared across retrievers."""
+
+    def _make_retriever(self, company):
+        r = SECDataRetrieval.__new__(SECDataRetrieval)
+        r.ticker = "AAPL"
+        r.company = company
+        for form in ("tenk", "tenq", "eightk", "twentyf"):
+            setattr(r, f"_{form}_filing", None)
+            setattr(r, f"_{form}_obj", None)
+            setattr(r, f"_{form}_metadata", None)
+        return r
+
+    def _company(self):
+        company = MagicMock()
+        filing = MagicMock(form="10-K", accession_number="acc-001")
+        company.latest.return_value = filing
+        return company, filing
+
+    def test_second_retriever_skips_lookup_and_parse(self):
+        company, filing = self._company()
+        first = self._make_retriever(company).get_tenk()
+        second = self._make_retriever(company).get_tenk()
+
+        assert first is second
+        assert company.latest.call_count == 1
+        assert filing.obj.call_count == 1
+
+    def test_metadata_set_on_cache_hit(self):
+        company, _ = self._company()
+        self._make_retriever(company).get_tenk_filing()
+        r = self._make_retriever(company)
+        r.get_tenk_filing()
+
+        assert r._tenk_metadata.accession == "acc-001"
+
+    def test_missing_filing_not_cached(self):
+        company = MagicMock()
+        company.latest.return_value = None
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                self._make_retriever(company).get_tenq_filing()
+
+        assert company.latest.call_count == 2
+
+
+@pytest.mark.eval_unit
+class TestDiskCache:
+    """Extracted sections and balance sheets persist per (ticker, accession)."""
+
+    @pytest.fixture(autouse=True)
+    def _cache_dir(self, monkeypatch, tmp_path):
+        from agents.sec_workflow import get_SEC_data
+
+        monkeypatch.setattr(get_SEC_data, "SEC_CACHE_DIR", str(tmp_path / "sec-cache"))
+
+    def _make_retriever(self, accession="0000320193-24-000123"):
+        import pandas as pd
+
+        r = SECDataRetrieval.__new__(SECDataRetrieval)
+        r.ticker = "aapl"
+        r._balance_sheet_dfs = {}
+        r._tenk_metadata = None
+        r.get_tenk_filing = MagicMock(return_value=MagicMock(accession_number=accession))
+        r.get_section = MagicMock(return_value={"text": "Risk text", "metadata": {}, "found": True})
+        r.get_tenk = MagicMock()
+        stmt = r.get_tenk.return_value.financials.balance_sheet.return_value
+        stmt.to_dataframe.return_value = pd.DataFrame({"2024": [1.0]}, index=["Total Assets"])
+        r._tenq_metadata = None
+        r.get_tenq_filing = MagicMock(return_value=MagicMock(accession_number=accession + "-q"))
+        r.get_tenq = r.get_tenk
+        return r
+
+    def test_section_served_from_disk_by_new_retriever(self, tmp_path):
+        self._make_retriever().extract_risk_factors("10-K")
+        r = self._make_retriever()
+
+        assert r.extract_risk_factors("10-K") == "Risk text"
+        r.get_section.assert_not_called()
+        assert (tmp_path / "sec-cache" / "AAPL" / "0000320193-24-000123" / "risk_factors.txt").exists()
+
+    def test_new_accession_misses(self):
+        self._make_retriever().extract_management_discussion("10-K")
+        r = self._make_retriever(accession="0000320193-25-000001")
+        r.extract_management_discussion("10-K")
+
+        r.get_section.assert_called_once_with("10-K", "7")
+
+    def test_missing_section_not_written(self):
+        first = self._make_retriever()
+        first.get_section.return_value = {"text": "Section not found", "metadata": {}, "found": False}
+        first.extract_risk_factors("10-K")
+        r = self._make_retriever()
+        r.extract_risk_factors("10-K")
+
+        r.get_section.assert_called_once()
+
+    def test_balance_sheet_skips_document_on_hit(self):
+        first = self._make_retriever().extract_balance_sheet_as_json("10-K")
+        r = self._make_retriever()
+
+        assert r.extract_balance_sheet_as_json("10-K")["tenk"] == first["tenk"]
+        assert r.extract_balance_sheet_as_str("10-K")["tenk"] == r._balance_sheet_json("10-K")
+        r.get_tenk.assert_not_called()
+
+    def test_both_forms_skip_downloads_on_hit(self):
+        self._make_retriever().extract_balance_sheet_as_json("both")
+        r = self._make_retriever()
+        out = r.extract_balance_sheet_as_json("both")
+
+        assert out["tenq"]["index"] == ["Total Assets"]
+        r.get_tenk.assert_not_called()
+
+    def test_disabled_when_dir_empty(self, monkeypatch, tmp_path):
+        from agents.sec_workflow import get_SEC_data
+
+        monkeypatch.setattr(get_SEC_data, "SEC_CACHE_DIR", "")
+        self._make_retriever().extract_risk_factors("10-K")
+        r = self._make_retriever()
+        r.extract_risk_factors("10-K")
+
+        r.get_section.assert_called_once()
+        assert not (tmp_path / "sec-cache").exists()
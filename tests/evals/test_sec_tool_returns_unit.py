@@ -361,3 +361,24 @@ class TestDispatcherRouting:
         )
         parsed = json.loads(sec_tools._tool_analyze_latest_8k(TICKER, llm=None))
         assert parsed["found"] is False
+
+
+@pytest.mark.eval_unit
+class TestDumpAnalysisJson:
+    """_dump_analysis_json emits strict JSON even for values model_dump() leaks."""
+
+    def test_numpy_nan_and_dates_serialize(self):
+        import datetime
+
+        import numpy as np
+
+        out = sec_tools._dump_analysis_json({
+            "ratio": np.float64(1.5),
+            "missing": float("nan"),
+            "as_of": datetime.date(2024, 9, 28),
+        })
+        parsed = json.loads(out)
+        assert parsed == {"ratio": 1.5, "missing": None, "as_of": "2024-09-28"}
+
+    def test_non_dict_wrapped_as_value(self):
+        assert json.loads(sec_tools._dump_analysis_json("oops")) == {"value": "oops"}
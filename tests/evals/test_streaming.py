@@ -8,13 +8,18 @@ Tests cover:
 - _process_streaming_chunk: parsing string vs list content from LLM chunks
 - stream_sync: node events, tool events, response events from graph streaming
 - Per-step streaming: workers emit one tool event each via Send fan-out
+- Async stream(): custom thinking/token events reach the caller; the ReAct
+  node streams its answer tokens
+- In-flight dedup: concurrent identical stream() calls share one graph run
 - Backward compat: invoke() still works after the refactor
 """
 
+import asyncio
+import threading
 import time
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from dataclasses import dataclass
 
 
@@ -25,13 +30,14 @@ def _async_iter(items):
             yield item
     return _gen()
 
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, ToolMessage
 from langchain_core.tools import Tool
 
 from agents.graph.analyst_graph import (
     _process_streaming_chunk,
     PlanningAgent,
     AnalysisState,
+    create_react_node,
     create_worker_node,
     create_reconciler_node,
     dispatch_steps,
@@ -214,6 +220,26 @@ class TestStreamSync:
         response_events = [e for e in events if e["type"] == "response"]
         assert response_events[0]["message"] == "AAPL is at $185"
 
+    @pytest.mark.eval_unit
+    def test_node_events_for_known_and_unknown_nodes(self):
+        items = [
+            ("updates", {"router": {"query_complexity": "simple"}}),
+            ("updates", {"custom_node": {}}),
+        ]
+        mock_workflow = MagicMock()
+        mock_workflow.astream.side_effect = lambda *a, **kw: _async_iter(items)
+
+        agent = PlanningAgent(mock_workflow, "AAPL")
+        node_events = [
+            e for e in agent.stream_sync({"messages": [HumanMessage(content="q")]})
+            if e["type"] == "node"
+        ]
+
+        assert node_events == [
+            {"type": "node", "node": "router", "message": "Classifying query complexity..."},
+            {"type": "node", "node": "custom_node", "message": "Running custom_node..."},
+        ]
+
     @pytest.mark.eval_unit
     def test_complex_query_yields_tool_events(self):
         """A complex query should yield one tool event per worker emission.
@@ -423,6 +449,310 @@ class TestPerStepStreaming:
         )
 
 
+# ---------------------------------------------------------------------------
+# Async stream(): custom events and ReAct token streaming
+# ---------------------------------------------------------------------------
+
+
+class _FakeReactAgent:
+    """Mimics create_react_agent's astream(stream_mode=["messages", "values"]).
+
+    One tool-calling turn (optionally with text before the call), then the
+    answer turn. Chunks of a message share an id and the last one is marked
+    ``chunk_position="last"``, as langchain-core streams them.
+    """
+
+    def __init__(self, preamble: str = ""):
+        self.ainvoke_calls = 0
+        self.preamble = preamble
+
+    async def ainvoke(self, inputs):
+        self.ainvoke_calls += 1
+        return {"messages": inputs["messages"] + [AIMessage(content="Price is $1")]}
+
+    async def astream(self, inputs, stream_mode=None):
+        agent_meta = {"langgraph_node": "agent"}
+        tool_meta = {"langgraph_node": "tools"}
+        yield ("values", inputs)
+        if self.preamble:
+            yield ("messages", (AIMessageChunk(content=self.preamble, id="run-1"), agent_meta))
+        yield ("messages", (AIMessageChunk(content="", id="run-1", tool_call_chunks=[
+            {"name": "get_stock_info", "args": "", "id": "1", "index": 0}
+        ]), agent_meta))
+        yield ("messages", (AIMessageChunk(content="", id="run-1", chunk_position="last"), agent_meta))
+        yield ("values", inputs)
+        yield ("messages", (AIMessageChunk(content='{"inner": "tool llm"}', id="run-t"), tool_meta))
+        yield ("messages", (ToolMessage(content="raw tool output", tool_call_id="1"), tool_meta))
+        yield ("values", inputs)
+        yield ("messages", (AIMessageChunk(content="Price ", id="run-2"), agent_meta))
+        yield ("messages", (AIMessageChunk(content="is $1", id="run-2"), agent_meta))
+        yield ("messages", (AIMessageChunk(content="", id="run-2", chunk_position="last"), agent_meta))
+        yield ("values", {"messages": inputs["messages"] + [AIMessage(content="Price is $1")]})
+
+
+class TestAsyncStream:
+    @pytest.mark.eval_unit
+    async def test_custom_events_reach_caller(self):
+        mock_workflow = MagicMock()
+        items = [
+            ("custom", {"type": "token", "message": "Hel"}),
+            ("updates", {"synthesizer": {"final_response": "Hello"}}),
+        ]
+        mock_workflow.astream.side_effect = lambda *a, **kw: _async_iter(items)
+        agent = PlanningAgent(mock_workflow, "AAPL")
+
+        events = [e async for e in agent.stream({"messages": [HumanMessage(content="q")]})]
+
+        assert {"type": "token", "message": "Hel"} in events
+        assert events[-1] == {"type": "response", "message": "Hello"}
+
+    @pytest.mark.eval_unit
+    async def test_astream_yields_answer_tokens_only(self):
+        mock_workflow = MagicMock()
+        items = [
+            ("updates", {"router": {"query_complexity": "complex"}}),
+            ("custom", {"type": "thinking", "message": "hmm"}),
+            ("custom", {"type": "token", "message": "Hel"}),
+            ("custom", {"type": "token", "message": "lo"}),
+            ("updates", {"synthesizer": {"final_response": "Hello"}}),
+        ]
+        mock_workflow.astream.side_effect = lambda *a, **kw: _async_iter(items)
+        agent = PlanningAgent(mock_workflow, "AAPL")
+
+        chunks = [c async for c in agent.astream({"messages": [HumanMessage(content="q")]})]
+
+        assert chunks == ["Hel", "lo"]
+
+    @pytest.mark.eval_unit
+    async def test_astream_falls_back_to_whole_response(self):
+        mock_workflow = MagicMock()
+        items = [("updates", {"router": {"final_response": "Please clarify."}})]
+        mock_workflow.astream.side_effect = lambda *a, **kw: _async_iter(items)
+        agent = PlanningAgent(mock_workflow, "AAPL")
+
+        chunks = [c async for c in agent.astream({"messages": [HumanMessage(content="?")]})]
+
+        assert chunks == ["Please clarify."]
+
+    @pytest.mark.eval_unit
+    async def test_react_node_streams_only_answer_tokens(self):
+        from langgraph.graph import StateGraph, END
+
+        graph = StateGraph(AnalysisState)
+        graph.add_node("react_agent", create_react_node(_FakeReactAgent()))
+        graph.set_entry_point("react_agent")
+        graph.add_edge("react_agent", END)
+        agent = PlanningAgent(graph.compile(), "AAPL")
+
+        events = [e async for e in agent.stream({"messages": [HumanMessage(content="price?")]})]
+
+        tokens = [e["message"] for e in events if e["type"] == "token"]
+        assert tokens == ["Price ", "is $1"]
+        assert events[-1] == {"type": "response", "message": "Price is $1"}
+
+    @pytest.mark.eval_unit
+    async def test_react_node_drops_text_before_tool_call(self):
+        from langgraph.graph import StateGraph, END
+
+        graph = StateGraph(AnalysisState)
+        graph.add_node(
+            "react_agent", create_react_node(_FakeReactAgent(preamble="Let me look up the price. "))
+        )
+        graph.set_entry_point("react_agent")
+        graph.add_edge("react_agent", END)
+        agent = PlanningAgent(graph.compile(), "AAPL")
+
+        events = [e async for e in agent.stream({"messages": [HumanMessage(content="price?")]})]
+
+        tokens = [e["message"] for e in events if e["type"] == "token"]
+        assert tokens == ["Price ", "is $1"]
+        assert "".join(tokens) == events[-1]["message"]
+
+    @pytest.mark.eval_unit
+    async def test_react_node_without_writer_uses_ainvoke(self):
+        react_agent = _FakeReactAgent()
+        node = create_react_node(react_agent)
+
+        state = await node({"messages": [HumanMessage(content="price?")]})
+
+        assert react_agent.ainvoke_calls == 1
+        assert state["final_response"] == "Price is $1"
+
+    @pytest.mark.eval_unit
+    async def test_react_agent_factory_built_once_on_first_use(self):
+        built = []
+
+        def factory():
+            built.append(_FakeReactAgent())
+            return built[-1]
+
+        node = create_react_node(agent_factory=factory)
+        assert built == []
+
+        await node({"messages": [HumanMessage(content="price?")]})
+        await node({"messages": [HumanMessage(content="price?")]})
+
+        assert len(built) == 1
+        assert built[0].ainvoke_calls == 2
+
+
+# ---------------------------------------------------------------------------
+# In-flight dedup: concurrent identical queries share one graph run
+# ---------------------------------------------------------------------------
+
+
+class _CountingWorkflow:
+    """Fake compiled graph whose astream() counts runs and yields slowly."""
+
+    def __init__(self, fail: bool = False):
+        self.runs = 0
+        self.fail = fail
+
+    async def astream(self, initial_state, stream_mode=None, config=None):
+        self.runs += 1
+        await asyncio.sleep(0.05)
+        if self.fail and self.runs == 1:
+            raise RuntimeError("boom")
+        yield ("updates", {"react_agent": {"final_response": "shared answer"}})
+
+
+async def _collect(agent, query):
+    return [e async for e in agent.stream({"messages": [HumanMessage(content=query)]})]
+
+
+class _TokenWorkflow:
+    """Fake compiled graph that streams tokens one by one, gated by an event."""
+
+    def __init__(self):
+        self.runs = 0
+        self.release = asyncio.Event()
+
+    async def astream(self, initial_state, stream_mode=None, config=None):
+        self.runs += 1
+        yield ("custom", {"type": "token", "content": "a"})
+        await self.release.wait()
+        yield ("custom", {"type": "token", "content": "b"})
+
+
+class TestInflightDedup:
+    """stream() coalesces identical concurrent requests when a namespace is set."""
+
+    @pytest.mark.eval_unit
+    async def test_identical_concurrent_queries_run_once(self):
+        workflow = _CountingWorkflow()
+        agent = PlanningAgent(workflow, "AAPL", dedup_namespace="ns")
+
+        first, second = await asyncio.gather(_collect(agent, "price?"), _collect(agent, "price?"))
+
+        assert workflow.runs == 1
+        assert first == second
+        assert first[-1] == {"type": "response", "message": "shared answer"}
+        assert PlanningAgent._inflight.get(asyncio.get_running_loop(), {}) == {}
+
+    @pytest.mark.eval_unit
+    async def test_different_queries_not_coalesced(self):
+        workflow = _CountingWorkflow()
+        agent = PlanningAgent(workflow, "AAPL", dedup_namespace="ns")
+
+        await asyncio.gather(_collect(agent, "price?"), _collect(agent, "risks?"))
+
+        assert workflow.runs == 2
+
+    @pytest.mark.eval_unit
+    async def test_no_namespace_disables_dedup(self):
+        workflow = _CountingWorkflow()
+        agent = PlanningAgent(workflow, "AAPL")
+
+        await asyncio.gather(_collect(agent, "price?"), _collect(agent, "price?"))
+
+        assert workflow.runs == 2
+
+    @pytest.mark.eval_unit
+    async def test_waiter_runs_itself_when_leader_fails(self):
+        workflow = _CountingWorkflow(fail=True)
+        agent = PlanningAgent(workflow, "AAPL", dedup_namespace="ns")
+
+        leader, follower = await asyncio.gather(
+            _collect(agent, "price?"), _collect(agent, "price?"), return_exceptions=True
+        )
+
+        assert isinstance(leader, RuntimeError)
+        assert follower[-1]["message"] == "shared answer"
+        assert workflow.runs == 2
+        assert PlanningAgent._inflight.get(asyncio.get_running_loop(), {}) == {}
+
+    @pytest.mark.eval_unit
+    async def test_waiter_receives_events_live(self):
+        workflow = _TokenWorkflow()
+        agent = PlanningAgent(workflow, "AAPL", dedup_namespace="ns")
+        inputs = {"messages": [HumanMessage(content="price?")]}
+        leader = agent.stream(inputs)
+        follower = agent.stream(inputs)
+
+        assert await leader.__anext__() == {"type": "token", "content": "a"}
+        # The follower sees the first token while the run is still blocked.
+        assert await follower.__anext__() == {"type": "token", "content": "a"}
+        assert not workflow.release.is_set()
+
+        workflow.release.set()
+        assert [e async for e in follower] == [{"type": "token", "content": "b"}]
+        assert [e async for e in leader] == [{"type": "token", "content": "b"}]
+        assert workflow.runs == 1
+
+    @pytest.mark.eval_unit
+    async def test_waiter_finishes_when_leader_abandons(self):
+        workflow = _TokenWorkflow()
+        agent = PlanningAgent(workflow, "AAPL", dedup_namespace="ns")
+        inputs = {"messages": [HumanMessage(content="price?")]}
+        leader = agent.stream(inputs)
+        follower = agent.stream(inputs)
+
+        await leader.__anext__()
+        await follower.__anext__()
+        await leader.aclose()
+
+        workflow.release.set()
+        assert [e async for e in follower] == [{"type": "token", "content": "b"}]
+        assert workflow.runs == 1
+
+    @pytest.mark.eval_unit
+    async def test_different_api_keys_not_coalesced(self):
+        from agents.graph.analyst_graph import create_planning_agent
+
+        workflow = _CountingWorkflow()
+        # create_llm hands out one instance per API key; two keys, two instances.
+        llm_a, llm_b = MagicMock(), MagicMock()
+        with patch("agents.graph.analyst_graph.create_planning_workflow", return_value=workflow):
+            agent_a = create_planning_agent("AAPL", llm_a, tavily_api_key="tvly-a")
+            agent_b = create_planning_agent("AAPL", llm_b, tavily_api_key="tvly-a")
+            agent_c = create_planning_agent("AAPL", llm_a, tavily_api_key="tvly-b")
+
+        await asyncio.gather(
+            _collect(agent_a, "price?"), _collect(agent_b, "price?"), _collect(agent_c, "price?")
+        )
+
+        assert workflow.runs == 3
+        assert "tvly-a" not in agent_a.dedup_namespace
+
+    @pytest.mark.eval_unit
+    def test_runs_not_shared_across_event_loops(self):
+        workflow = _CountingWorkflow()
+        agent = PlanningAgent(workflow, "AAPL", dedup_namespace="ns")
+        results = []
+
+        def run_in_own_loop():
+            results.append(asyncio.run(_collect(agent, "price?")))
+
+        threads = [threading.Thread(target=run_in_own_loop) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 2
+        assert all(r[-1]["message"] == "shared answer" for r in results)
+
+
 # ---------------------------------------------------------------------------
 # Backward compatibility: invoke() still works
 # ---------------------------------------------------------------------------
@@ -461,3 +791,16 @@ class TestInvokeBackwardCompat:
 
         assert "messages" in result
         assert len(result["messages"]) == 1  # No AIMessage added
+
+    @pytest.mark.eval_unit
+    async def test_ainvoke_awaits_workflow(self):
+        """ainvoke() drives workflow.ainvoke and shapes the result like invoke()."""
+        mock_workflow = MagicMock()
+        mock_workflow.ainvoke = AsyncMock(return_value={"final_response": "AAPL is at $185"})
+
+        agent = PlanningAgent(mock_workflow, "AAPL")
+        result = await agent.ainvoke({"messages": [HumanMessage(content="price?")]})
+
+        mock_workflow.ainvoke.assert_awaited_once()
+        mock_workflow.invoke.assert_not_called()
+        assert result["messages"][-1].content == "AAPL is at $185"
@@ -12,7 +12,13 @@ fails this test instead of silently re-introducing the cost vector.
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage
 
-from agents.graph.analyst_graph import _build_synthesis_prompt
+from agents.graph import analyst_graph
+from agents.graph.analyst_graph import (
+    _bind_synthesis_template,
+    _build_synthesis_prompt,
+    _single_step_passthrough,
+    create_synthesizer_node,
+)
 from agents.planner import AnalysisStep, QueryPlan
 
 
@@ -90,3 +96,115 @@ class TestSynthesisPromptInvariant:
         )
         prompt = _build_synthesis_prompt(state, "AAPL")
         assert "LATEST_USER_QUERY" in prompt
+
+    def test_bound_template_matches_unbound(self):
+        state = _state([HumanMessage(content="risks?")])
+        bound = _build_synthesis_prompt(state, "AAPL", _bind_synthesis_template("AAPL"))
+        assert bound == _build_synthesis_prompt(state, "AAPL")
+
+    def test_precomputed_latest_query_is_used(self):
+        """`latest_query` set at run start wins over rescanning messages."""
+        state = _state([HumanMessage(content="scanned")])
+        state["latest_query"] = "PRECOMPUTED_QUERY"
+        prompt = _build_synthesis_prompt(state, "AAPL")
+        assert "PRECOMPUTED_QUERY" in prompt
+        assert "scanned" not in prompt
+
+    def test_initial_state_resolves_latest_query(self):
+        agent = analyst_graph.PlanningAgent(workflow=None, ticker="AAPL")
+        state = agent._build_initial_state(
+            [HumanMessage(content="first"), AIMessage(content="a"), HumanMessage(content="second")]
+        )
+        assert state["latest_query"] == "second"
+
+    def test_initial_states_do_not_share_containers(self):
+        agent = analyst_graph.PlanningAgent(workflow=None, ticker="AAPL")
+        first = agent._build_initial_state([HumanMessage(content="q")])
+        second = agent._build_initial_state([HumanMessage(content="q")])
+
+        assert first["ticker"] == "AAPL"
+        assert first["plan"] is None and first["final_response"] == ""
+        assert first["step_results"] is not second["step_results"]
+        assert first["conflicts"] is not second["conflicts"]
+
+
+class _ExplodingLLM:
+    """Synthesizer LLM that must not be called."""
+
+    async def ainvoke(self, prompt):
+        raise AssertionError("synthesizer LLM should have been skipped")
+
+
+@pytest.mark.eval_unit
+class TestSingleStepPassthrough:
+    def test_prose_single_step_passes_through(self):
+        state = _state([HumanMessage(content="risks?")])
+        assert _single_step_passthrough(state) == "Some risk factor analysis text."
+
+    def test_structured_result_goes_to_llm(self):
+        state = _state([HumanMessage(content="risks?")])
+        state["step_results"][1]["data"] = {"summary": "x"}
+        assert _single_step_passthrough(state) is None
+
+    def test_error_result_goes_to_llm(self):
+        state = _state([HumanMessage(content="risks?")])
+        state["step_results"][1]["error"] = "boom"
+        assert _single_step_passthrough(state) is None
+
+    def test_multi_step_plan_goes_to_llm(self):
+        state = _state([HumanMessage(content="risks?")])
+        state["plan"].steps.append(
+            AnalysisStep(id=2, action="More", tool="get_stock_info", rationale="r")
+        )
+        assert _single_step_passthrough(state) is None
+
+    async def test_synthesizer_skips_llm(self):
+        synthesizer = create_synthesizer_node(_ExplodingLLM(), "AAPL")
+        result = await synthesizer(_state([HumanMessage(content="risks?")]))
+        assert result["final_response"] == "Some risk factor analysis text."
+
+
+@pytest.mark.eval_unit
+class TestWorkflowCache:
+    @pytest.fixture(autouse=True)
+    def _stub_build(self, monkeypatch):
+        analyst_graph._workflow_cache.clear()
+        self.builds = []
+
+        def fake_build(llm, ticker, tavily_api_key=None, synthesizer_llm=None, user_id=None):
+            self.builds.append(ticker)
+            return object()
+
+        monkeypatch.setattr(analyst_graph, "_build_planning_workflow", fake_build)
+        yield
+        analyst_graph._workflow_cache.clear()
+
+    def test_same_key_reuses_compiled_graph(self):
+        llm = object()
+        first = analyst_graph.create_planning_workflow(llm, "AAPL")
+        second = analyst_graph.create_planning_workflow(llm, "AAPL")
+        assert first is second
+        assert self.builds == ["AAPL"]
+
+    def test_distinct_llm_instances_not_shared(self):
+        # Each LLM instance carries its caller's API key.
+        analyst_graph.create_planning_workflow(object(), "AAPL")
+        analyst_graph.create_planning_workflow(object(), "AAPL")
+        assert len(self.builds) == 2
+
+    def test_ticker_user_and_research_split_entries(self):
+        llm = object()
+        analyst_graph.create_planning_workflow(llm, "AAPL")
+        analyst_graph.create_planning_workflow(llm, "MSFT")
+        analyst_graph.create_planning_workflow(llm, "AAPL", user_id="user_1")
+        analyst_graph.create_planning_workflow(llm, "AAPL", tavily_api_key="tvly")
+        assert len(self.builds) == 4
+
+    def test_tavily_key_not_stored_raw(self):
+        llm = object()
+        analyst_graph.create_planning_workflow(llm, "AAPL", tavily_api_key="tvly-secret")
+        analyst_graph.create_planning_workflow(llm, "AAPL", tavily_api_key="tvly-secret")
+        analyst_graph.create_planning_workflow(llm, "AAPL", tavily_api_key="tvly-other")
+
+        assert len(self.builds) == 2
+        assert all("tvly-secret" not in key for key in analyst_graph._workflow_cache.keys())
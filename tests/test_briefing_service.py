@@ -333,6 +333,33 @@ class TestParallelFanOut:
         assert elapsed < 1.5, f"Fan-out blocked on hung ticker: {elapsed:.2f}s"
 
 
+class TestGatherTickerData:
+    def test_tickers_fetched_in_parallel_and_order_kept(self, service):
+        def slow_entry(ticker):
+            time_mod.sleep(0.2)
+            return {"ticker": ticker}
+
+        with patch.object(service, "_fetch_ticker_entry", side_effect=slow_entry):
+            t0 = time_mod.perf_counter()
+            result = service._gather_ticker_data(["A", "B", "C", "D"])
+            elapsed = time_mod.perf_counter() - t0
+
+        assert [e["ticker"] for e in result] == ["A", "B", "C", "D"]
+        assert elapsed < 0.6, f"Ticker fetch took {elapsed:.2f}s — looks serial"
+
+    def test_failing_ticker_becomes_error_entry(self, service):
+        with patch(
+            "agents.technical_workflow.get_stock_data.YahooFinanceDataRetrieval",
+            side_effect=RuntimeError("boom"),
+        ):
+            result = service._gather_ticker_data(["AAPL"])
+
+        assert result == [{"ticker": "AAPL", "error": "boom"}]
+
+    def test_empty_watchlist(self, service):
+        assert service._gather_ticker_data([]) == []
+
+
 class TestInvokeWithTimeout:
     def test_returns_result_when_fast(self):
         search = MagicMock()
@@ -451,6 +478,27 @@ class TestCaching:
                         assert service._synthesize.call_count == 2
 
 
+    def test_data_sources_fetched_concurrently(self, service, mock_llm):
+        """Ticker data, regime and news run side by side, not back to back."""
+        def slow(value):
+            def _fetch(*args):
+                time_mod.sleep(0.2)
+                return value
+            return _fetch
+
+        sample_result = BriefingResult(analysis=SAMPLE_ANALYSIS, thinking="")
+        with patch.object(service, "_gather_ticker_data", side_effect=slow([{"ticker": "AAPL"}])):
+            with patch.object(service, "_get_market_regime", side_effect=slow({"error": "skip"})):
+                with patch.object(service, "_gather_news", side_effect=slow({"AAPL": []})):
+                    with patch.object(service, "_synthesize", return_value=sample_result) as synth:
+                        start = time_mod.monotonic()
+                        service.generate(["AAPL"], user_id="u1", model_id="m1")
+                        elapsed = time_mod.monotonic() - start
+
+        assert elapsed < 0.5, f"Took {elapsed:.2f}s — fetches likely ran sequentially"
+        synth.assert_called_once_with([{"ticker": "AAPL"}], {"error": "skip"}, {"AAPL": []})
+
+
 # ---------------------------------------------------------------------------
 # "Since last briefing" diff
 # ---------------------------------------------------------------------------
@@ -4,7 +4,7 @@ Verifies:
 - Oversized auth frames close with policy_violation (1008).
 - Auth frames missing within the timeout close cleanly.
 - Malformed JSON auth payloads close with 1008.
-- `_safe_send` closes the socket when send_json hangs past the send timeout.
+- `_safe_send` closes the socket when a send hangs past the send timeout.
 
 The route's full happy path is covered elsewhere (those tests require a live
 LLM and Tavily). The hardening tests here only need to reach the rejection
@@ -95,15 +95,15 @@ class TestInvalidAuthJson:
 class TestSafeSendTimeout:
     @pytest.mark.asyncio
     async def test_safe_send_closes_on_send_timeout(self, monkeypatch):
-        """_safe_send must close the socket if send_json hangs past the timeout."""
+        """_safe_send must close the socket if the send hangs past the timeout."""
         monkeypatch.setattr(chat, "WS_SEND_TIMEOUT_SECONDS", 0.1)
 
         sends_seen: list[dict] = []
         close_calls: list[int] = []
 
         class HangingWebSocket:
-            async def send_json(self, data):
-                sends_seen.append(data)
+            async def send_text(self, text):
+                sends_seen.append(json.loads(text))
                 # Hang past the send timeout
                 await asyncio.sleep(1.0)
 
@@ -125,8 +125,8 @@ class TestSafeSendTimeout:
             def __init__(self):
                 self.sent: list[dict] = []
 
-            async def send_json(self, data):
-                self.sent.append(data)
+            async def send_text(self, text):
+                self.sent.append(json.loads(text))
 
             async def close(self, code: int = 1000):
                 pass
@@ -252,6 +252,29 @@ class TestProfilePartialFailure:
         assert data["company"]["name"] == "Apple Inc."
 
 
+class TestProfileSerialization:
+    def test_numpy_scalars_and_nan_are_json_safe(self, client, mock_profile_deps):
+        import numpy as np
+
+        mock_profile_deps["ti"].calculate_all_indicators.return_value = {
+            "rsi": {"current": np.float64(58.3), "signal": "neutral"},
+            "volatility": {"daily_volatility": np.int64(1), "annualized_volatility": float("nan")},
+        }
+        resp = client.get("/api/company/MSFT/profile")
+        assert resp.status_code == 200
+        technicals = resp.json()["technicals"]
+        assert technicals["rsi"]["current"] == 58.3
+        assert technicals["volatility"] == {"daily_volatility": 1, "annualized_volatility": None}
+
+    def test_values_orjson_rejects_fall_back_to_stdlib(self, client, mock_profile_deps):
+        mock_profile_deps["ti"].calculate_all_indicators.return_value = {
+            "volatility": {"daily_volatility": 2**70},
+        }
+        resp = client.get("/api/company/MSFT/profile")
+        assert resp.status_code == 200
+        assert resp.json()["technicals"]["volatility"]["daily_volatility"] == 2**70
+
+
 # ── Bounded cache (Phase 3 hardening) ──────────────────────────────────────
 
 
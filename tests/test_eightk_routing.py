@@ -62,6 +62,9 @@ class _FakeRetriever:
         self._item_text = item_text
         self._eightk_metadata = eightk_meta
 
+    def prefetch(self, forms=(), metadata_only=()) -> None:
+        pass
+
     def get_tenk_filing(self):
         raise ValueError("no tenk in this fixture")
 
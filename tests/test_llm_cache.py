@@ -0,0 +1,217 @@
+"""Tests for the exact-match LLM response cache (agents/llm_cache.py).
+
+Router classification, planning and synthesis all send a fully-rendered
+prompt; an identical prompt to an identically-configured model within the
+TTL must be served from the cache without calling the LLM again.
+"""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from agents import llm_cache
+from agents.graph.analyst_graph import create_synthesizer_node
+from agents.planner import (
+    AnalysisStep,
+    QueryClassification,
+    QueryPlan,
+    QueryPlanner,
+    _bind_template,
+    _normalize_query,
+)
+from agents.prompts import QUERY_CLASSIFIER_PROMPT, TOOL_CAPABILITIES
+
+
+class _FakeLLM:
+    """Counts calls; identifies itself like a real chat model."""
+
+    def __init__(self, model: str = "fake-model", temperature: float = 0.0):
+        self.model = model
+        self.temperature = temperature
+        self.ainvoke_calls = 0
+        self.structured_calls = 0
+
+    @property
+    def _identifying_params(self):
+        return {"model": self.model, "temperature": self.temperature}
+
+    async def ainvoke(self, prompt):
+        self.ainvoke_calls += 1
+        return AIMessage(content=f"answer #{self.ainvoke_calls}")
+
+    def with_structured_output(self, schema):
+        parent = self
+
+        class _Structured:
+            def invoke(self, prompt):
+                parent.structured_calls += 1
+                if schema is QueryClassification:
+                    return QueryClassification(
+                        complexity="simple", reasoning="one metric", estimated_tools=1
+                    )
+                return QueryPlan(
+                    query_type="complex",
+                    requires_planning=True,
+                    steps=[AnalysisStep(id=1, action="a", tool="get_stock_info", rationale="r")],
+                )
+
+        return _Structured()
+
+
+def _synthesis_state(query: str = "How is AAPL doing?"):
+    # Two steps — a single prose step bypasses the synthesizer LLM entirely.
+    plan = QueryPlan(
+        query_type="complex",
+        requires_planning=True,
+        steps=[
+            AnalysisStep(id=1, action="Get info", tool="get_stock_info", rationale="r"),
+            AnalysisStep(id=2, action="Get macro", tool="get_market_overview", rationale="r"),
+        ],
+    )
+    return {
+        "messages": [HumanMessage(content=query)],
+        "ticker": "AAPL",
+        "plan": plan,
+        "step_results": {
+            1: {"tool": "get_stock_info", "data": {}, "raw": "price $1", "filing_ref": None, "error": None},
+            2: {"tool": "get_market_overview", "data": {}, "raw": "calm", "filing_ref": None, "error": None},
+        },
+        "conflicts": [],
+        "final_response": "",
+    }
+
+
+class TestCacheKey:
+    def test_key_is_stable(self):
+        llm = _FakeLLM()
+        assert llm_cache.make_cache_key("ns", llm, "p") == llm_cache.make_cache_key("ns", llm, "p")
+
+    def test_key_varies_by_model_config(self):
+        a = llm_cache.make_cache_key("ns", _FakeLLM(model="a"), "p")
+        b = llm_cache.make_cache_key("ns", _FakeLLM(model="b"), "p")
+        c = llm_cache.make_cache_key("ns", _FakeLLM(model="a", temperature=1.0), "p")
+        assert len({a, b, c}) == 3
+
+    def test_key_varies_by_api_key(self):
+        from pydantic import SecretStr
+
+        a, b = _FakeLLM(), _FakeLLM()
+        a.api_key = SecretStr("sk-user-a")
+        b.api_key = SecretStr("sk-user-b")
+
+        assert llm_cache.make_cache_key("ns", a, "p") != llm_cache.make_cache_key("ns", b, "p")
+        assert "sk-user-a" not in llm_cache.model_identity(a)
+
+    def test_real_chat_model_key_in_identity(self):
+        from langchain_openai import ChatOpenAI
+
+        a = ChatOpenAI(model="gpt-4o-mini", api_key="sk-user-a")
+        b = ChatOpenAI(model="gpt-4o-mini", api_key="sk-user-b")
+
+        assert llm_cache.model_identity(a) != llm_cache.model_identity(b)
+
+    def test_key_varies_by_namespace_and_prompt(self):
+        llm = _FakeLLM()
+        keys = {
+            llm_cache.make_cache_key("classify", llm, "p"),
+            llm_cache.make_cache_key("plan", llm, "p"),
+            llm_cache.make_cache_key("classify", llm, "q"),
+        }
+        assert len(keys) == 3
+
+    def test_empty_values_not_cached(self):
+        llm_cache.set_cached_response("k", "")
+        assert llm_cache.get_cached_response("k") is None
+
+
+class TestSynthesizerCache:
+    async def test_repeat_prompt_skips_llm(self):
+        llm = _FakeLLM()
+        synthesizer = create_synthesizer_node(llm, "AAPL")
+
+        first = await synthesizer(_synthesis_state())
+        second = await synthesizer(_synthesis_state())
+
+        assert llm.ainvoke_calls == 1
+        assert first["final_response"] == second["final_response"] == "answer #1"
+
+    async def test_different_query_misses(self):
+        llm = _FakeLLM()
+        synthesizer = create_synthesizer_node(llm, "AAPL")
+
+        await synthesizer(_synthesis_state("How is AAPL doing?"))
+        await synthesizer(_synthesis_state("What are AAPL's risks?"))
+
+        assert llm.ainvoke_calls == 2
+
+
+class TestPlannerCache:
+    def test_classify_query_cached(self):
+        llm = _FakeLLM()
+        planner = QueryPlanner(llm, "AAPL")
+
+        first = planner.classify_query("What is the P/E?")
+        second = planner.classify_query("What is the P/E?")
+
+        assert llm.structured_calls == 1
+        assert first == second
+        # Callers get their own copy — mutating one can't poison the cache.
+        assert first is not second
+
+    def test_create_plan_cached_per_ticker(self):
+        llm = _FakeLLM()
+        QueryPlanner(llm, "AAPL").create_plan("Compare risks and revenue")
+        QueryPlanner(llm, "AAPL").create_plan("Compare risks and revenue")
+        QueryPlanner(llm, "MSFT").create_plan("Compare risks and revenue")
+
+        assert llm.structured_calls == 2
+
+    def test_clear_llm_cache(self):
+        llm = _FakeLLM()
+        planner = QueryPlanner(llm, "AAPL")
+        planner.classify_query("What is the P/E?")
+        llm_cache.clear_llm_cache()
+        planner.classify_query("What is the P/E?")
+
+        assert llm.structured_calls == 2
+
+    def test_paraphrase_noise_shares_entry(self):
+        llm = _FakeLLM()
+        planner = QueryPlanner(llm, "AAPL")
+        planner.classify_query("What is AAPL's P/E?")
+        planner.classify_query("  what is   aapl's p/e ")
+
+        assert llm.structured_calls == 1
+
+    def test_research_availability_splits_entries(self):
+        llm = _FakeLLM()
+        QueryPlanner(llm, "AAPL", has_research_tools=False).classify_query("news?")
+        QueryPlanner(llm, "AAPL", has_research_tools=True).classify_query("news?")
+
+        assert llm.structured_calls == 2
+
+
+class TestNormalizeQuery:
+    def test_case_whitespace_and_trailing_punctuation(self):
+        assert _normalize_query("  What's the  P/E?\n") == "what's the p/e"
+
+    def test_inner_punctuation_kept(self):
+        assert _normalize_query("Latest 8-K vs 10-K") == "latest 8-k vs 10-k"
+
+
+class TestBindTemplate:
+    def test_bound_fields_substituted_rest_left_open(self):
+        bound = _bind_template("{ticker} {{json}} {query}", ticker="AAPL")
+        assert bound.format(query="q") == "AAPL {json} q"
+
+    def test_braces_in_bound_values_survive(self):
+        bound = _bind_template("{note}: {query}", note="use {curly}")
+        assert bound.format(query="q") == "use {curly}: q"
+
+    def test_planner_prompt_matches_unbound_format(self):
+        planner = QueryPlanner(_FakeLLM(), "AAPL")
+        expected = QUERY_CLASSIFIER_PROMPT.format(
+            ticker="AAPL",
+            tool_capabilities=TOOL_CAPABILITIES,
+            research_note="Research tools are NOT available.",
+            query="What is the P/E?",
+        )
+        assert planner._classify_template.format(query="What is the P/E?") == expected
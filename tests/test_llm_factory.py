@@ -161,3 +161,33 @@ class TestCreateLlmPair:
 
         assert main is synth
         assert mock_init.call_count == 1
+
+
+class TestLlmInstanceSharing:
+    @patch("langchain.chat_models.init_chat_model")
+    def test_same_model_and_key_share_instance(self, mock_init):
+        mock_init.side_effect = lambda *a, **kw: MagicMock()
+        first = create_llm("gpt-4.1-mini", "fake-key")
+        second = create_llm("gpt-4.1-mini", "fake-key")
+
+        assert first is second
+        assert mock_init.call_count == 1
+
+    @patch("langchain.chat_models.init_chat_model")
+    def test_key_and_thinking_split_instances(self, mock_init):
+        mock_init.side_effect = lambda *a, **kw: MagicMock()
+        base = create_llm("gemini-3-flash-preview", "key-a")
+        other_key = create_llm("gemini-3-flash-preview", "key-b")
+        thinking = create_llm(
+            "gemini-3-flash-preview", "key-a", thinking=ThinkingConfig(enabled=True)
+        )
+
+        assert len({id(base), id(other_key), id(thinking)}) == 3
+
+    @patch("langchain.chat_models.init_chat_model")
+    def test_pair_reused_across_sessions(self, mock_init):
+        mock_init.side_effect = lambda *a, **kw: MagicMock()
+        assert create_llm_pair("gemini-3-flash-preview", "k") == create_llm_pair(
+            "gemini-3-flash-preview", "k"
+        )
+        assert mock_init.call_count == 2
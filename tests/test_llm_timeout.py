@@ -56,8 +56,9 @@ async def test_run_with_timeout_includes_label_in_error(monkeypatch):
 
 
 class _FakePlanner:
-    """Minimal QueryPlanner stand-in. classify_query/create_plan are sync (the
-    real planner calls llm.invoke); these stubs sleep to trigger the timeout."""
+    """Minimal QueryPlanner stand-in. classify_query/create_plan/classify_and_plan
+    are sync (the real planner calls llm.invoke); these stubs sleep to trigger
+    the timeout."""
 
     def __init__(self, sleep_seconds: float):
         self._sleep = sleep_seconds
@@ -72,6 +73,11 @@ class _FakePlanner:
         time.sleep(self._sleep)
         return None
 
+    def classify_and_plan(self, query):
+        import time
+        time.sleep(self._sleep)
+        return None, None
+
 
 @pytest.mark.asyncio
 async def test_router_node_times_out(monkeypatch):
@@ -22,6 +22,7 @@ from api.main import (
     app,
     check_production_auth_config,
     check_production_sec_config,
+    configure_sec_storage,
     set_sec_identity,
 )
 
@@ -192,6 +193,27 @@ def test_set_sec_identity_falls_back_to_default(monkeypatch):
     mock_set_identity.assert_called_once_with(_DEFAULT_SEC_HEADER)
 
 
+# ---------------------------------------------------------------------------
+# configure_sec_storage — opt-in edgartools on-disk store
+# ---------------------------------------------------------------------------
+
+
+def test_sec_storage_off_by_default(monkeypatch):
+    monkeypatch.delenv("SEC_LOCAL_DATA_DIR", raising=False)
+    with patch("api.main.use_local_storage") as mock_use_local:
+        configure_sec_storage()
+    mock_use_local.assert_not_called()
+
+
+def test_sec_storage_enabled_with_dir(monkeypatch, tmp_path):
+    storage_dir = tmp_path / "edgar"
+    monkeypatch.setenv("SEC_LOCAL_DATA_DIR", str(storage_dir))
+    with patch("api.main.use_local_storage") as mock_use_local:
+        configure_sec_storage()
+    assert storage_dir.is_dir()
+    mock_use_local.assert_called_once_with(storage_dir, allow_network_fallback=True)
+
+
 # ---------------------------------------------------------------------------
 # Integration: real lifespan with SEC guard
 # ---------------------------------------------------------------------------
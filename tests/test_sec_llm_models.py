@@ -0,0 +1,159 @@
+"""Tests for SECDocumentProcessor prompt building (agents/sec_workflow/sec_llm_models.py)."""
+
+from langchain_core.messages import AIMessage
+
+from agents.sec_workflow import sec_llm_models
+from agents.sec_workflow.sec_llm_models import SECDocumentProcessor, _truncate_section_text
+
+
+class _FakeLLM:
+    def invoke(self, prompt):
+        return AIMessage(content="{}")
+
+
+def _user_message(prompt) -> str:
+    return prompt.format_messages()[-1].content
+
+
+class TestTruncateSectionText:
+    def test_short_text_untouched(self):
+        assert _truncate_section_text("short", max_tokens=10) == "short"
+
+    def test_keeps_head_and_tail_on_line_boundaries(self):
+        text = "\n".join(["HEAD " * 5, "MIDDLE " * 40, "TAIL " * 2])
+        out = _truncate_section_text(text, max_tokens=15)  # 60 chars
+
+        assert out.startswith("HEAD ")
+        assert out.endswith("TAIL " * 2)
+        assert "MIDDLE" not in out
+        assert "middle of section omitted" in out
+
+    def test_no_boundary_falls_back_to_hard_cuts(self):
+        out = _truncate_section_text("A" * 50 + "Z" * 50, max_tokens=10)  # 40 chars
+        head, tail = out.split(sec_llm_models._TRUNCATION_MARKER)
+
+        assert head == "A" * 30
+        assert tail == "Z" * 10
+
+
+class TestPromptTruncation:
+    def test_mda_prompt_bounded(self, monkeypatch):
+        monkeypatch.setattr(sec_llm_models, "SEC_SECTION_MAX_TOKENS", 100)
+        processor = SECDocumentProcessor(_FakeLLM())
+        prompt = processor.generate_mda_prompt("AAPL", {"text": "x" * 10_000, "metadata": {}})
+
+        assert "x" * 401 not in _user_message(prompt)
+        assert "middle of section omitted" in _user_message(prompt)
+
+    def test_text_section_prompt_bounded(self, monkeypatch):
+        monkeypatch.setattr(sec_llm_models, "SEC_SECTION_MAX_TOKENS", 100)
+        processor = SECDocumentProcessor(_FakeLLM())
+        prompt = processor._text_section_prompt(
+            sec_llm_models.BUSINESS_OVERVIEW_SYSTEM_PROMPT,
+            sec_llm_models.BUSINESS_OVERVIEW_USER_TEMPLATE,
+            processor.business_overview_parser,
+            "AAPL",
+            {"text": "y" * 10_000, "metadata": {}},
+        )
+
+        assert "y" * 401 not in _user_message(prompt)
+
+
+class TestFormatInstructions:
+    def test_rendered_once_per_schema(self):
+        sec_llm_models._format_instructions.cache_clear()
+        processor = SECDocumentProcessor(_FakeLLM())
+        processor.generate_mda_prompt("AAPL", {"text": "a", "metadata": {}})
+        processor.generate_mda_prompt("MSFT", {"text": "b", "metadata": {}})
+
+        info = sec_llm_models._format_instructions.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_matches_parser_output(self):
+        processor = SECDocumentProcessor(_FakeLLM())
+        assert (
+            sec_llm_models._format_instructions(sec_llm_models.MDnAAnalysis)
+            == processor.mda_parser.get_format_instructions()
+        )
+
+
+class TestCacheablePrefix:
+    """Static content (role, rules, schema) leads; filing data comes last."""
+
+    def test_schema_in_system_message_identical_across_filings(self):
+        processor = SECDocumentProcessor(_FakeLLM())
+        a = processor.generate_mda_prompt(
+            "AAPL", {"text": "apple", "metadata": {"form": "10-K", "filing_date": "2024-11-01"}}
+        ).format_messages()
+        b = processor.generate_mda_prompt(
+            "MSFT", {"text": "msft", "metadata": {"form": "10-K", "filing_date": "2024-07-30"}}
+        ).format_messages()
+
+        schema = sec_llm_models._format_instructions(sec_llm_models.MDnAAnalysis)
+        assert a[0].content == b[0].content
+        assert schema in a[0].content
+        assert schema not in a[1].content
+
+    def test_every_section_prompt_keeps_schema_out_of_user_message(self):
+        processor = SECDocumentProcessor(_FakeLLM())
+        prompt = processor.generate_balance_sheet_prompt("AAPL", {"tenk": "{}"}, {})
+        system, user = prompt.format_messages()
+
+        assert "Follow this JSON schema EXACTLY" in system.content
+        assert "Follow this JSON schema EXACTLY" not in user.content
+
+
+class TestSectionTemplate:
+    def test_template_parsed_once_and_partials_isolated(self):
+        sec_llm_models._section_template.cache_clear()
+        processor = SECDocumentProcessor(_FakeLLM())
+        aapl = processor.generate_risk_factors_prompt(
+            "AAPL", {"text": "supply chain", "metadata": {"form": "10-K"}}
+        )
+        msft = processor.generate_risk_factors_prompt(
+            "MSFT", {"text": "cloud outage", "metadata": {"form": "10-Q"}}
+        )
+
+        assert sec_llm_models._section_template.cache_info().misses == 1
+        assert "supply chain" in _user_message(aapl)
+        assert "cloud outage" in _user_message(msft)
+        assert "supply chain" not in _user_message(msft)
+
+    def test_form_type_bound_from_metadata(self):
+        processor = SECDocumentProcessor(_FakeLLM())
+        prompt = processor.generate_mda_prompt("AAPL", {"text": "t", "metadata": {"form": "10-Q"}})
+
+        assert "10-Q" in "".join(m.content for m in prompt.format_messages())
+
+
+class _FailingLLM:
+    def invoke(self, prompt):
+        raise RuntimeError("provider down")
+
+
+class TestFallbacks:
+    def test_mda_fallback_on_chain_failure(self):
+        processor = SECDocumentProcessor(_FailingLLM())
+        result = processor.analyze_mda("AAPL", {"text": "t", "metadata": {"form": "10-K"}})
+
+        assert isinstance(result, sec_llm_models.MDnAAnalysis)
+        assert result.summary == "Error analyzing MD&A section."
+        assert result.form_type == "10-K"
+
+    def test_fallback_tolerates_non_string_metadata(self):
+        processor = SECDocumentProcessor(_FailingLLM())
+        data = {"text": "t", "metadata": {"form": "10-K", "items": ["1A"]}}
+        result = processor.analyze_risk_factors("AAPL", data)
+
+        assert result.filing_metadata == data["metadata"]
+
+
+class TestBalanceSheetPrompt:
+    def test_describes_split_json_and_labels_forms(self):
+        processor = SECDocumentProcessor(_FakeLLM())
+        tenk = {"columns": ["label", "2024-09-28"], "index": [0], "data": [["Cash", 1.0]]}
+        user = _user_message(processor.generate_balance_sheet_prompt("AAPL", tenk, {}))
+
+        assert '"split" JSON' in user
+        assert "10-K (annual):" in user
+        assert "Cash" in user